@@ -1,11 +1,8 @@
 from dash.dependencies import Input, Output, State
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-import logging
 from . import utils, components
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
 # List of cryptos to track; adjust as needed.
 cryptos = ["BTC", "ETH"]
 
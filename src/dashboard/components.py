@@ -9,8 +9,6 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.io as pio
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
 # Initialize the API client
 api_trading_client = CryptoAPITrading()
 
@@ -2,11 +2,8 @@
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
-import logging
 from .. import utils
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
 def generate_pnl_charts():
     """
     Fetches daily PnL data from utils.get_daily_pnl_data(),
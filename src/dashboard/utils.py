@@ -10,8 +10,6 @@ import pandas as pd
 import datetime
 import plotly.graph_objects as go
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
 # Initialize the API client once
 client = CryptoAPITrading()
 
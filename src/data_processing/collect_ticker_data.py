@@ -10,6 +10,7 @@ import pyarrow as pa
 from datetime import datetime, timedelta
 import argparse
 import gc
+from concurrent.futures import ThreadPoolExecutor
 from src.robinhood_api.api_access import CryptoAPITrading
 
 # Apply nest_asyncio to allow nested event loops
@@ -21,13 +22,104 @@ INTERVAL_SECONDS = {'1s': 1, '1m': 60, '5m': 300, '30m': 1800}
 # Default number of data points to collect per batch.
 BATCH_SIZE = 250
 
+# Upper bound on threads used to read temp files during consolidation.
+MAX_READ_WORKERS = 8
+
+# Index of temp batch files, one "<file name>\t<YYYY-MM-DD>" line per saved file. The leading
+# underscore makes Parquet dataset readers skip it when reading data/{ticker}.
+MANIFEST_FILENAME = "_manifest.tsv"
+
+# Manifest name used by earlier versions; renamed on startup
+LEGACY_MANIFEST_FILENAME = "manifest.tsv"
+
+# Numeric quote fields saved per data point, as (column, index into response["results"], response key).
+# The estimated_price response for side="both" holds the bid quote first and the ask quote second.
+QUOTE_FIELDS = (
+    ("price_bid", 0, "price"),
+    ("bid_inclusive_of_sell_spread", 0, "bid_inclusive_of_sell_spread"),
+    ("sell_spread", 0, "sell_spread"),
+    ("price_ask", 1, "price"),
+    ("ask_inclusive_of_buy_spread", 1, "ask_inclusive_of_buy_spread"),
+    ("buy_spread", 1, "buy_spread"),
+)
+
+
+def read_manifest(temp_folder):
+    """
+    Reads the temp folder manifest written by save_to_parquet.
+
+    Returns:
+        A list of (file_name, date_str) tuples, or None if the folder has no manifest.
+    """
+    manifest_path = os.path.join(temp_folder, MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, "r") as f:
+        return [tuple(line.rstrip("\n").split("\t")) for line in f if line.strip()]
+
+
+def scan_batch_files(temp_folder):
+    """
+    Lists the batch files in the temp folder by name.
+
+    Returns:
+        A dict mapping each "batch_YYYY-MM-DD_HHMMSS.parquet" file name to its date string.
+    """
+    batch_files = {}
+    for filepath in glob.glob(os.path.join(temp_folder, "*.parquet")):
+        file_name = os.path.basename(filepath)  # e.g. "batch_2023-04-26_123456.parquet"
+        parts = file_name.split("_")
+        if len(parts) < 3:
+            continue  # Skip any file that doesn't match the pattern
+        try:
+            datetime.strptime(parts[1], "%Y-%m-%d")
+        except ValueError:
+            continue
+        batch_files[file_name] = parts[1]
+    return batch_files
+
+
+def reconcile_manifest(temp_folder):
+    """
+    Brings the temp folder manifest in line with the batch files actually in the folder. Run once
+    at startup: it adds files saved before the folder had a manifest, or by a run that stopped between
+    writing a file and recording it, and drops entries whose file is gone.
+    """
+    if not os.path.isdir(temp_folder):
+        return
+    manifest_path = os.path.join(temp_folder, MANIFEST_FILENAME)
+    legacy_path = os.path.join(temp_folder, LEGACY_MANIFEST_FILENAME)
+    if os.path.exists(legacy_path) and not os.path.exists(manifest_path):
+        os.replace(legacy_path, manifest_path)
+    manifest = read_manifest(temp_folder)
+    batch_files = scan_batch_files(temp_folder)
+    entries = [entry for entry in manifest or [] if entry[0] in batch_files]
+    listed = {file_name for file_name, _ in entries}
+    entries.extend(
+        (file_name, date_str) for file_name, date_str in sorted(batch_files.items()) if file_name not in listed
+    )
+    if entries != manifest:
+        write_manifest(temp_folder, entries)
+
+
+def write_manifest(temp_folder, entries):
+    """
+    Atomically replaces the temp folder manifest with the given (file_name, date_str) entries.
+    """
+    manifest_path = os.path.join(temp_folder, MANIFEST_FILENAME)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.writelines(f"{file_name}\t{date_str}\n" for file_name, date_str in entries)
+    os.replace(tmp_path, manifest_path)
+
 
 def consolidate_parquet_files_partitioned(ticker):
     """
     Merges all Parquet files in the temp folder that belong to previous days
     into partitioned files (year/month/day) for faster queries.
 
-    Expects filenames in the format:
+    Files are selected from the temp folder manifest, so no directory scan is needed.
+    If the manifest is missing, falls back to scanning for filenames in the format:
         batch_YYYY-MM-DD_HHMMSS.parquet
     where YYYY-MM-DD is the UTC date for that file.
 
@@ -40,11 +132,43 @@ def consolidate_parquet_files_partitioned(ticker):
         logging.getLogger(ticker).info(f"Error: {temp_folder} does not exist.")
         return
 
+    manifest = read_manifest(temp_folder)
+    if manifest is not None:
+        # Date strings are zero-padded ISO dates, so string comparison orders them correctly
+        today_utc_str = datetime.utcnow().strftime("%Y-%m-%d")
+        remaining_entries = [entry for entry in manifest if entry[1] >= today_utc_str]
+        files_to_consolidate = [
+            os.path.join(temp_folder, file_name) for file_name, date_str in manifest if date_str < today_utc_str
+        ]
+        # Skip entries whose file was already removed (e.g. an interrupted previous run)
+        files_to_consolidate = [fp for fp in files_to_consolidate if os.path.exists(fp)]
+    else:
+        remaining_entries = None
+        files_to_consolidate = find_previous_day_files(ticker, temp_folder)
+
+    if not files_to_consolidate:
+        logging.getLogger(ticker).info("No files to consolidate for previous day.")
+        if remaining_entries is not None and len(remaining_entries) != len(manifest):
+            write_manifest(temp_folder, remaining_entries)
+        return
+
+    if not consolidate_files(ticker, project_root, temp_folder, files_to_consolidate):
+        return
+
+    if remaining_entries is not None:
+        write_manifest(temp_folder, remaining_entries)
+
+
+def find_previous_day_files(ticker, temp_folder):
+    """
+    Scans the temp folder for batch files dated before today's UTC date.
+    Used when the folder has no manifest.
+    """
     # Collect all parquet files in the temp folder
     parquet_files_all = sorted(glob.glob(os.path.join(temp_folder, "*.parquet")))
     if not parquet_files_all:
         logging.getLogger(ticker).info(f"No Parquet files found in {temp_folder}. Skipping consolidation.")
-        return
+        return []
 
     logging.getLogger(ticker).info(f"Found {len(parquet_files_all)} total files in {temp_folder}.")
 
@@ -70,15 +194,26 @@ def consolidate_parquet_files_partitioned(ticker):
         if file_date < today_utc_date:
             files_to_consolidate.append(filepath)
 
-    if not files_to_consolidate:
-        logging.getLogger(ticker).info("No files to consolidate for previous day.")
-        return
+    return files_to_consolidate
+
 
+def consolidate_files(ticker, project_root, temp_folder, files_to_consolidate):
+    """
+    Merges the given temp files into the partitioned dataset under data/{ticker}/
+    and removes them from the temp folder.
+
+    Returns:
+        True if the files were consolidated, False if they were left in place.
+    """
     logging.getLogger(ticker).info(f"Consolidating {len(files_to_consolidate)} file(s) from {temp_folder}...")
 
-    # Read them all into one DataFrame
-    df_list = [pd.read_parquet(fp) for fp in files_to_consolidate]
-    df = pd.concat(df_list, ignore_index=True)
+    # Read them all into one DataFrame. Parquet decoding releases the GIL,
+    # so reading the files on a small thread pool overlaps I/O and decompression.
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(files_to_consolidate))) as executor:
+        tables = list(executor.map(pq.read_table, files_to_consolidate))
+    # Concatenate in pandas rather than Arrow: temp files written by older versions may store a
+    # column as string where newer ones store float64, which pa.concat_tables refuses to merge.
+    df = pd.concat([table.to_pandas() for table in tables], ignore_index=True, sort=False)
 
     # Drop columns that aren't needed
     columns_to_drop = ['quantity', 'side_bid', 'side_ask']
@@ -94,7 +229,7 @@ def consolidate_parquet_files_partitioned(ticker):
     # Ensure 'Date' column exists and is properly typed
     if 'Date' not in df.columns:
         logging.getLogger(ticker).error("Error: 'Date' column missing in consolidated data. Skipping consolidation.")
-        return
+        return False
 
     df['Date'] = pd.to_datetime(df['Date'], utc=True)
     df['Date'] = df['Date'].dt.tz_localize(None)
@@ -140,6 +275,7 @@ def consolidate_parquet_files_partitioned(ticker):
         os.remove(fp)
 
     logging.getLogger(ticker).info(f"Partitioned data saved in {partitioned_output_path}")
+    return True
 
 
 async def get_price(client, ticker):
@@ -194,16 +330,18 @@ def save_to_parquet(results, ticker, interval):
     if not results:
         return
 
-    # Build DataFrame from the combined bid/ask results
-    bid_data = pd.DataFrame([r["results"][0] for r in results if r is not None])
-    ask_data = pd.DataFrame([r["results"][1] for r in results if r is not None])
-    df = pd.merge(bid_data, ask_data, on=["timestamp", "symbol", "quantity"], suffixes=("_bid", "_ask"))
-
-    # Drop columns you don't need
-    df.drop(columns=["quantity", "side_bid", "side_ask"], inplace=True)
-
-    # Convert timestamp to UTC datetime
-    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+    # Build the DataFrame column by column from the known response schema. Filling typed
+    # arrays directly skips per-row dict construction and pandas' dtype inference.
+    quotes = [r["results"] for r in results if r is not None]
+    if not quotes:
+        return
+    columns = {
+        "timestamp": pd.to_datetime([q[0]["timestamp"] for q in quotes], utc=True),
+        "symbol": [q[0]["symbol"] for q in quotes],
+    }
+    for column, index, key in QUOTE_FIELDS:
+        columns[column] = np.fromiter((float(q[index][key]) for q in quotes), dtype=np.float64, count=len(quotes))
+    df = pd.DataFrame(columns)
 
     # Create a separate column for the date (YYYY-MM-DD in UTC)
     df["date"] = df["timestamp"].dt.strftime("%Y-%m-%d")
@@ -220,6 +358,8 @@ def save_to_parquet(results, ticker, interval):
         file_path = os.path.join(temp_folder, file_name)
 
         date_df.to_parquet(file_path, compression="snappy", index=False)
+        with open(os.path.join(temp_folder, MANIFEST_FILENAME), "a") as manifest:
+            manifest.write(f"{file_name}\t{date_str}\n")
         logging.getLogger(ticker).info(f"Saved daily batch for {ticker} — {date_str}: {file_path}")
 
 async def writer(queue, ticker, interval):
@@ -241,6 +381,7 @@ async def collect_data_continuous(client, ticker, interval='1s', batch_size=BATC
     """
     Continuously collects data for a given ticker and pushes each batch to a writer queue.
     """
+    reconcile_manifest(os.path.join(os.getcwd(), "data", ticker, "temp"))
     queue = asyncio.Queue(maxsize=5)
     writer_task = asyncio.create_task(writer(queue, ticker, interval))
     try:
@@ -270,7 +411,11 @@ async def new_day_watcher(tickers):
         await asyncio.sleep(seconds_to_midnight + 10)  # Add a small buffer.
         logging.getLogger().info("New day detected. Starting consolidation for all tickers...")
         for ticker in tickers:
-            consolidate_parquet_files_partitioned(ticker)
+            try:
+                consolidate_parquet_files_partitioned(ticker)
+            except Exception as e:
+                # Keep collecting; the temp files stay in place for the next consolidation
+                logging.getLogger(ticker).error(f"Consolidation failed for {ticker}: {e}")
         logging.getLogger().info("Consolidation complete for all tickers.")
 
 
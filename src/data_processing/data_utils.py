@@ -1,13 +1,7 @@
 import os
-import glob
 import pandas as pd
-from decimal import Decimal, getcontext
-
-# Set the precision you need
-getcontext().prec = 28
 
 import os
-import glob
 import pandas as pd
 import numpy as np
 
@@ -43,25 +37,28 @@ def load_historical_data(ticker, start_date=None, end_date=None, ohlc_interval=N
         print(f"No data directory found for {ticker} at interval {'1s'}.")
         return pd.DataFrame()
 
-    # List all date-based folders
-    date_folders = sorted([folder for folder in os.listdir(data_dir) if os.path.isdir(os.path.join(data_dir, folder))])
-
-    # Apply date filters if provided
-    if start_date:
-        date_folders = [folder for folder in date_folders if folder >= start_date]
-    if end_date:
-        date_folders = [folder for folder in date_folders if folder <= end_date]
+    # List the date-based folders within the requested range. scandir entries carry
+    # their file type, so this avoids a stat call per folder.
+    with os.scandir(data_dir) as entries:
+        date_folders = sorted(
+            entry.name for entry in entries
+            if entry.is_dir()
+            and (not start_date or entry.name >= start_date)
+            and (not end_date or entry.name <= end_date)
+        )
 
     df_list = []
 
     # Iterate over date folders and load all batch files within each day
     for date_folder in date_folders:
-        batch_files = glob.glob(os.path.join(data_dir, date_folder, "*.parquet"))
+        with os.scandir(os.path.join(data_dir, date_folder)) as entries:
+            # Batch file names embed their save time, so name order is chronological
+            batch_files = sorted(entry.path for entry in entries if entry.name.endswith(".parquet") and entry.is_file())
         if not batch_files:
             continue  # Skip folders with no files
 
         daily_df_list = [pd.read_parquet(batch) for batch in batch_files]
-        daily_df = pd.concat(daily_df_list, ignore_index=True)
+        daily_df = pd.concat(daily_df_list, ignore_index=True, sort=False)
 
         df_list.append(daily_df)
 
@@ -71,7 +68,7 @@ def load_historical_data(ticker, start_date=None, end_date=None, ohlc_interval=N
         return pd.DataFrame()
 
     # Concatenate all daily dataframes
-    combined_df = pd.concat(df_list, ignore_index=True)
+    combined_df = pd.concat(df_list, ignore_index=True, sort=False)
 
     # Ensure timestamps are correct
     combined_df['timestamp'] = pd.to_datetime(combined_df['timestamp'], utc=True)
@@ -103,8 +100,10 @@ def load_historical_data(ticker, start_date=None, end_date=None, ohlc_interval=N
     present_columns = [col for col in desired_column_order if col in combined_df.columns]
     combined_df = combined_df[present_columns]
 
-    # Sort data by 'Date' since batches are not necessarily saved in order
-    combined_df = combined_df.sort_values(by='Date', ascending=True).reset_index(drop=True)
+    # Days and batches are concatenated in chronological order, so the data is usually
+    # already sorted; only pay for a sort when a batch was saved out of order.
+    if not combined_df['Date'].is_monotonic_increasing:
+        combined_df = combined_df.sort_values(by='Date', ascending=True, kind='stable').reset_index(drop=True)
 
     # Define the columns to convert
     cols_to_convert = [
@@ -176,7 +175,7 @@ def load_trades(start_date=None, end_date=None):
         raise FileNotFoundError(f"No trade logs found in range {start_date} to {end_date}")
 
     # Load data
-    trades = pd.concat([pd.read_csv(file) for file in trade_files], ignore_index=True)
+    trades = pd.concat([pd.read_csv(file) for file in trade_files], ignore_index=True, sort=False)
 
     # Ensure datetime format
     trades["Buy Timestamp"] = pd.to_datetime(trades["Buy Timestamp"])
@@ -1,5 +1,10 @@
-import datetime
+import os
+from datetime import datetime, timedelta
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import schedule
 
 class ExecutionSummary:
@@ -7,43 +12,64 @@ class ExecutionSummary:
     Handles periodic summary updates of execution performance.
     """
 
-    def __init__(self, trade_log="trade_log.csv", summary_file="execution_summary.csv"):
+    def __init__(self, trade_log="trade_log", summary_file="execution_summary.csv"):
+        """
+        Args:
+            trade_log: Directory holding the trade log as a Parquet dataset (one file per appended batch).
+            summary_file: CSV file the hourly summaries are appended to.
+        """
         self.trade_log = trade_log
         self.summary_file = summary_file
 
+    def append_trades(self, trades):
+        """
+        Appends a batch of trade records to the trade log.
+
+        Each batch is written as its own zstd-compressed Parquet file, so the log is
+        append-only and older files never need to be rewritten.
+
+        Args:
+            trades: List of dictionaries, one per trade, including a "Timestamp" key.
+        """
+        if not trades:
+            return
+        os.makedirs(self.trade_log, exist_ok=True)
+        file_name = f"trades_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S_%f')}.parquet"
+        pq.write_table(pa.Table.from_pylist(trades), os.path.join(self.trade_log, file_name), compression="zstd")
+
     def update_summary(self):
         """
         Reads the trade log, aggregates execution statistics,
         and updates a summary file every hour.
         """
         try:
-            df = pd.read_csv(self.trade_log)
-
-            # Convert timestamps to datetime format
-            df["Timestamp"] = pd.to_datetime(df["Timestamp"])
-
-            # Filter last 1 hour of trades
-            one_hour_ago = datetime.now() - pd.Timedelta(hours=1)
-            df = df[df["Timestamp"] > one_hour_ago]
+            # Only read the last hour of trades; the Timestamp predicate is pushed down so
+            # Parquet row-group statistics skip older data without decoding it.
+            now = datetime.now()
+            one_hour_ago = now - timedelta(hours=1)
+            table = ds.dataset(self.trade_log, format="parquet").to_table(
+                columns=["Estimated Slippage (%)", "Actual Slippage (%)", "Execution Price"],
+                filter=ds.field("Timestamp") > pa.scalar(one_hour_ago),
+            )
 
-            if df.empty:
+            if table.num_rows == 0:
                 print("[INFO] No new trades in the last hour.")
                 return
 
             # Calculate average slippage, execution price, and spreads
             summary = {
-                "Timestamp": datetime.now(),
-                "Total Trades": len(df),
-                "Avg Estimated Slippage (%)": df["Estimated Slippage (%)"].mean(),
-                "Avg Actual Slippage (%)": df["Actual Slippage (%)"].mean(),
-                "Avg Execution Price": df["Execution Price"].mean(),
+                "Timestamp": now,
+                "Total Trades": table.num_rows,
+                "Avg Estimated Slippage (%)": pc.mean(table["Estimated Slippage (%)"]).as_py(),
+                "Avg Actual Slippage (%)": pc.mean(table["Actual Slippage (%)"]).as_py(),
+                "Avg Execution Price": pc.mean(table["Execution Price"]).as_py(),
             }
 
             # Append to summary file
             summary_df = pd.DataFrame([summary])
-            summary_df.to_csv(self.summary_file, mode="a", header=not pd.io.common.file_exists(self.summary_file), index=False)
+            summary_df.to_csv(self.summary_file, mode="a", header=not os.path.exists(self.summary_file), index=False)
 
-            print(f"[SUMMARY] Execution summary updated at {datetime.now()}")
+            print(f"[SUMMARY] Execution summary updated at {now}")
 
         except Exception as e:
             print(f"[ERROR] Failed to update summary: {e}")
@@ -1,18 +1,20 @@
 import time
-import datetime
-import pandas as pd
+import csv
 import os
+import numpy as np
 import logging
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from src.robinhood_api.api_access import CryptoAPITrading
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, TextIO, Tuple
 from src.robinhood_api.market_data import MarketData
 
-# Configure logging (this is better than print)
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Maximum number of concurrent per-symbol price requests
+MAX_PRICE_WORKERS = 8
+
 
 class PortfolioMonitor:
     """
@@ -20,13 +22,28 @@ class PortfolioMonitor:
     (Simplified: No trade logging or execution summaries)
     """
 
-    def __init__(self, api_trading_client: CryptoAPITrading, data_dir: str = "data"):
+    def __init__(self, api_trading_client: CryptoAPITrading, data_dir: str = "data", flush_every: int = 5):
+        """
+        Args:
+            api_trading_client: The Robinhood API client.
+            data_dir: Directory under which account data is saved.
+            flush_every: Number of monitoring cycles to buffer before writing rows to disk.
+        """
         self.api_trading_client = api_trading_client
         self.data_dir = data_dir
         self.account_data_dir = os.path.join(self.data_dir, "account")
         self._ensure_directories_exist()
         self.market_data_client = MarketData(api_trading_client.api_client)
         self.running = True
+        # Open append handle and CSV writer per output file, reused across cycles
+        self._writers: Dict[str, Tuple[TextIO, csv.DictWriter]] = {}
+        # Rows waiting to be written, keyed by file path
+        self._row_buffer: Dict[str, List[Dict[str, Any]]] = {}
+        self.flush_every = flush_every
+        self._cycles_since_flush = 0
+        # Last formatted Date value and the epoch second it was formatted for
+        self._last_ts_sec = None
+        self._last_ts_str = ""
 
     def _ensure_directories_exist(self):
         """
@@ -40,18 +57,83 @@ class PortfolioMonitor:
 
     def _save_to_csv(self, data: List[Dict[str, Any]], filename: str):
         """
-        Saves data to a CSV file, appending if the file exists.
+        Queues data to be appended to a CSV file on the next flush.
 
         Args:
             data: The list of dictionaries to save.
             filename: The name of the CSV file.
         """
         filepath = os.path.join(self.account_data_dir, filename)
-        df = pd.DataFrame(data)
         # add a date column
-        df.insert(0, 'Date', datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-        df.to_csv(filepath, mode="a", header=not os.path.exists(filepath), index=False)
-        logger.info(f"Saved data to {filepath}")
+        timestamp = self._current_timestamp()
+        self._row_buffer.setdefault(filepath, []).extend({"Date": timestamp, **entry} for entry in data)
+
+    def _current_timestamp(self) -> str:
+        """
+        Returns the current local time as 'YYYY-MM-DD HH:MM:SS', formatting it
+        at most once per second.
+        """
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+            self._last_ts_sec = now
+        return self._last_ts_str
+
+    def _flush(self):
+        """
+        Writes all buffered rows to their CSV files, one writerows call per file.
+        """
+        for filepath, rows in self._row_buffer.items():
+            if not rows:
+                continue
+            file_handle, writer = self._get_writer(filepath, list(dict.fromkeys(key for row in rows for key in row)))
+            writer.writerows(rows)
+            file_handle.flush()
+            logger.info(f"Saved {len(rows)} row(s) to {filepath}")
+        self._row_buffer.clear()
+        self._cycles_since_flush = 0
+
+    def _get_writer(self, filepath: str, fieldnames: List[str]) -> Tuple[TextIO, csv.DictWriter]:
+        """
+        Returns the cached append handle and CSV writer for a file, opening it on first use.
+
+        A header is written only when the file is new or empty; otherwise the column
+        order of the existing header is kept.
+
+        Args:
+            filepath: The path of the CSV file.
+            fieldnames: Columns to use if the file has no header yet.
+
+        Returns:
+            A (file handle, csv.DictWriter) tuple.
+        """
+        if filepath in self._writers:
+            return self._writers[filepath]
+
+        # The header decision is made once per file, when its writer is first opened
+        try:
+            write_header = os.stat(filepath).st_size == 0
+        except FileNotFoundError:
+            write_header = True
+        if not write_header:
+            with open(filepath, "r", newline="") as f:
+                fieldnames = next(csv.reader(f))
+
+        file_handle = open(filepath, "a", newline="", buffering=1 << 16)
+        writer = csv.DictWriter(file_handle, fieldnames=fieldnames, extrasaction="ignore")
+        if write_header:
+            writer.writeheader()
+        self._writers[filepath] = (file_handle, writer)
+        return file_handle, writer
+
+    def _close_writers(self):
+        """
+        Flushes and closes all open CSV files.
+        """
+        self._flush()
+        for file_handle, _ in self._writers.values():
+            file_handle.close()
+        self._writers.clear()
 
     def get_account_info(self) -> dict:
         """
@@ -91,61 +173,126 @@ class PortfolioMonitor:
             logger.error(f"Error fetching holdings: {e}")
             return []
 
-    def estimate_portfolio_value(self) -> float:
+    def estimate_portfolio_value(self, account_info: Optional[dict] = None,
+                                 holdings: Optional[List[dict]] = None) -> float:
         """
         Estimates the total portfolio value based on current holdings, including buying power.
 
         Uses the 'bid' side of the market data for a more conservative estimate.
 
+        Args:
+            account_info: Account information already fetched this cycle. Fetched if None.
+            holdings: Holdings already fetched this cycle. Fetched if None.
+
         Returns:
             The estimated portfolio value as a float.
         """
-        total_value = 0.0
-        holdings = self.get_holdings()
+        if holdings is None:
+            holdings = self.get_holdings()
+
+        # Drop empty (dust) holdings up front so no price is ever requested for them,
+        # then price the remaining positions with a single request
+        positions = {}
         for holding in holdings:
             try:
-                symbol = f"{holding['asset_code']}-USD"  # Construct symbol
+                symbol = f"{holding['asset_code']}-USD"
                 quantity = float(holding["total_quantity"])
-                if quantity == 0:
-                    continue
-
-                # Use 'bid' side for a more conservative estimate
-                real_time_price = self.market_data_client.get_adj_est_price(
-                    symbol=symbol, side="bid", quantity=1.0
-                )
-                if real_time_price is not None:
-                    holding_value = quantity * real_time_price
-                    total_value += holding_value
             except Exception as e:
-                logger.error(f"Error calculating value for {symbol}: {e}")
+                logger.error(f"Error reading holding {holding}: {e}")
+                continue
+            if quantity > 0:
+                positions[symbol] = quantity
+
+        try:
+            # Use 'bid' side for a more conservative estimate
+            prices = self.market_data_client.get_adj_est_prices(list(positions), side="bid")
+        except Exception as e:
+            logger.error(f"Error fetching prices for holdings: {e}")
+            prices = {}
+
+        # Fall back to per-symbol estimated prices for anything the batch request missed
+        missing_symbols = [symbol for symbol in positions if symbol not in prices]
+        if missing_symbols:
+            prices.update(self._fetch_prices_concurrently(missing_symbols))
+
+        for symbol in positions.keys() - prices.keys():
+            logger.error(f"No price available for {symbol}")
+        priced_symbols = [symbol for symbol in positions if symbol in prices]
+
+        # Sum quantity * price over all priced holdings as a single dot product
+        quantities = np.fromiter((positions[symbol] for symbol in priced_symbols), dtype=np.float64,
+                                 count=len(priced_symbols))
+        unit_prices = np.fromiter((prices[symbol] for symbol in priced_symbols), dtype=np.float64,
+                                  count=len(priced_symbols))
+        total_value = float(quantities @ unit_prices)
+
         # add buying power to the total value.
-        account_info = self.get_account_info()
+        if account_info is None:
+            account_info = self.get_account_info()
         if account_info:
             buying_power = float(account_info["buying_power"])
             total_value += buying_power
 
         return total_value
 
+    def _fetch_prices_concurrently(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Fetches bid-side adjusted prices one symbol per request, with the requests
+        issued concurrently since each is an independent network round-trip.
+
+        Args:
+            symbols: The trading pair symbols to price.
+
+        Returns:
+            A dictionary of adjusted prices keyed by symbol. Failed lookups are omitted.
+        """
+        prices = {}
+        with ThreadPoolExecutor(max_workers=min(MAX_PRICE_WORKERS, len(symbols))) as executor:
+            futures = {
+                executor.submit(self.market_data_client.get_adj_est_price, symbol, "bid", 1.0): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    real_time_price = future.result()
+                except Exception as e:
+                    logger.error(f"Error calculating value for {symbol}: {e}")
+                    continue
+                if real_time_price is not None:
+                    prices[symbol] = real_time_price
+        return prices
+
     def monitor(self):
         """
         Collects and saves account, holdings, and portfolio value data.
         """
         logger.info("Monitoring portfolio...")
         try:
-            account_info = self.get_account_info()
+            # The account and holdings requests are independent, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                account_future = executor.submit(self.get_account_info)
+                holdings_future = executor.submit(self.get_holdings)
+                account_info = account_future.result()
+                holdings = holdings_future.result()
+
             if account_info:
                 self._save_to_csv([account_info], "account_info.csv")
 
-            holdings = self.get_holdings()
             if holdings:
                 self._save_to_csv(holdings, "holdings.csv")
 
-            portfolio_value = self.estimate_portfolio_value()
+            # Reuse this cycle's account and holdings data instead of fetching them again
+            portfolio_value = self.estimate_portfolio_value(account_info, holdings)
             if portfolio_value is not None:
                 self._save_to_csv([{"portfolio_value": portfolio_value}], "portfolio_value.csv")
         except Exception as e:
             logger.error(f"An error occurred during monitoring: {e}")
 
+        self._cycles_since_flush += 1
+        if self._cycles_since_flush >= self.flush_every:
+            self._flush()
+
     def run_continuously(self, interval_seconds: int = 60):
         """
         Runs the monitoring process continuously at a specified interval.
@@ -153,7 +300,8 @@ class PortfolioMonitor:
         Args:
             interval_seconds: The interval between monitoring runs in seconds (default: 120 seconds = 2 minutes).
         """
-        # Define signal handler function
+        # Define signal handler function. Buffered rows are flushed when the loop exits,
+        # rather than inside the handler, so a signal can't interleave with a write.
         def signal_handler(signum, frame):
             logger.info(f"Received signal {signum}. Stopping monitoring process.")
             self.running = False
@@ -162,13 +310,22 @@ class PortfolioMonitor:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
-        while self.running:
-            self.monitor()
-            time.sleep(interval_seconds)
+        # Schedule runs against a monotonic deadline so the cadence doesn't drift by
+        # however long each monitor() call took. A cycle that overruns its slot skips
+        # ahead instead of triggering back-to-back catch-up runs.
+        next_run = time.monotonic()
+        try:
+            while self.running:
+                self.monitor()
+                next_run = max(next_run + interval_seconds, time.monotonic())
+                time.sleep(max(0.0, next_run - time.monotonic()))
+        finally:
+            self._close_writers()
         logger.info("Monitoring stopped.")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     api_trading_client = CryptoAPITrading()
     monitor = PortfolioMonitor(api_trading_client)
     monitor.run_continuously()
\ No newline at end of file
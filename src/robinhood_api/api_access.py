@@ -1,4 +1,5 @@
 import base64
+import functools
 import os # added this import
 from src.robinhood_api.api_client import APIClient
 from src.robinhood_api.orders import Orders
@@ -17,21 +18,28 @@ private_key_path = os.path.join(keys_dir, "private_key_base64.txt")
 # Construct the absolute path to RH_key.txt
 rh_key_path = os.path.join(keys_dir, "RH_key.txt")
 
-# Read the private key
-with open(private_key_path, 'r') as private_file:
-    BASE64_PRIVATE_KEY = private_file.read().strip()
 
-# Read the private key
-with open(rh_key_path, 'r') as rh_key:
-    API_KEY = rh_key.read().strip()
+@functools.lru_cache(maxsize=None)
+def _load_private_key() -> str:
+    """Reads the base64-encoded private key on first use and caches it."""
+    with open(private_key_path, 'r') as private_file:
+        return private_file.read().strip()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_api_key() -> str:
+    """Reads the Robinhood API key on first use and caches it."""
+    with open(rh_key_path, 'r') as rh_key:
+        return rh_key.read().strip()
+
 
 class CryptoAPITrading:
     """
     Main class for interacting with the Robinhood API.
     """
     def __init__(self):
-        private_bytes = base64.b64decode(BASE64_PRIVATE_KEY)
-        self.api_client = APIClient(API_KEY, private_bytes)
+        private_bytes = base64.b64decode(_load_private_key())
+        self.api_client = APIClient(_load_api_key(), private_bytes)
         self.orders = Orders(self.api_client)
         self.market_data = MarketData(self.api_client)
-        self.account = Account(self.api_client)
\ No newline at end of file
+        self.account = Account(self.api_client)
@@ -2,12 +2,48 @@ import requests
 import json
 import logging
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Union
 import base64
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cryptography.hazmat.primitives.asymmetric import ed25519
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# PyNaCl (libsodium) signs faster than cryptography's Ed25519; use it when installed.
+# Its low-level bindings call crypto_sign directly, skipping the SigningKey wrappers.
+try:
+    from nacl.bindings import crypto_sign, crypto_sign_BYTES, crypto_sign_seed_keypair
+except ImportError:
+    crypto_sign = None
+
+# orjson serializes straight to bytes and decodes responses 2-3x faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# (connect, read) timeouts in seconds. A short connect timeout fails fast when a new
+# connection can't be established; reads keep the longer allowance.
+REQUEST_TIMEOUT = (2.0, 10.0)
+
+# Statuses retried with exponential backoff by the session's transport adapter (GET only)
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Attempts for a POST rejected as rate limited (429). The API did not process it, so it is re-signed and resent;
+# POSTs are never replayed after a timeout or 5xx, since the order may already have been placed.
+POST_RATE_LIMIT_ATTEMPTS = 3
+
+# Log description for each HTTP error status
+_STATUS_DESCRIPTION = {
+    429: "Rate limited",
+    500: "Server error",
+    502: "Bad gateway",
+    503: "Service unavailable",
+    504: "Gateway timeout",
+    400: "Bad request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not found",
+}
 
 class APIClient:
     """
@@ -15,75 +51,112 @@ class APIClient:
     """
     def __init__(self, api_key: str, private_key_bytes: bytes, base_url: str = "https://trading.robinhood.com"):
         self.api_key = api_key
-        self.private_key = ed25519.Ed25519PrivateKey.from_private_bytes(private_key_bytes[:32])
+        # Constant parts of every signed request, computed once
+        self._api_key_bytes = api_key.encode("utf-8")
+        self._header_template = {"x-api-key": api_key}
+        if crypto_sign is not None:
+            _, self._secret_key = crypto_sign_seed_keypair(private_key_bytes[:32])
+            self.private_key = None
+        else:
+            self._secret_key = None
+            self.private_key = ed25519.Ed25519PrivateKey.from_private_bytes(private_key_bytes[:32])
         self.base_url = base_url
+        # One pooled session for all requests so TCP/TLS connections are kept alive and
+        # reused across calls (and shared safely by worker threads). Rate limits and server
+        # errors on GETs are retried inside urllib3, which keeps the pooled connections open.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
 
     @staticmethod
     def _get_current_timestamp() -> int:
         """Gets the current timestamp in UTC."""
         return int(time.time())
 
-    def make_api_request(self, method: str, path: str, body: str = "") -> Any:
+    def make_api_request(self, method: str, path: str, body: Union[str, bytes, dict] = "") -> Any:
         """
         Makes a request to the Robinhood API.
 
         Args:
             method: The HTTP method (GET or POST).
             path: The API endpoint path.
-            body: The request body (for POST requests).
+            body: The request body (for POST requests), either a dict or already-serialized JSON.
 
         Returns:
             The JSON response from the API or None on error.
         """
-        timestamp = self._get_current_timestamp()
-        headers = self.get_authorization_header(method, path, body, timestamp)
+        # Serialize once; the exact bytes that are signed are the bytes that are sent
+        if isinstance(body, dict):
+            body = orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY) if orjson is not None else json.dumps(body)
+        body_bytes = body if isinstance(body, bytes) else body.encode("utf-8")
+
         url = self.base_url + path
-        max_retries = 3
-        retry_delay = 1  # Start with 1 second delay
-        for attempt in range(max_retries):
-            try:
-                response = {}
-                if method == "GET":
-                    response = requests.get(url, headers=headers, timeout=10)
-                elif method == "POST":
-                    response = requests.post(url, headers=headers, json=json.loads(body), timeout=10)
-                response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-                return response.json()
-            except requests.exceptions.HTTPError as http_err:
-                if response.status_code == 429:  # Rate limiting
-                    logging.warning(f"Rate limited on attempt {attempt + 1}/{max_retries}. Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                elif response.status_code == 500: # Server error
-                    logging.error(f"Server error on attempt {attempt + 1}/{max_retries}: {http_err} at URL: {url}, with response: {response.content}")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                elif response.status_code == 400:
-                    logging.error(f"Bad request: {http_err} at URL: {url}, with response: {response.content}")
-                    return None  # Or raise a custom exception
-                elif response.status_code == 401:
-                    logging.error(f"Unauthorized: {http_err} at URL: {url}, with response: {response.content}")
-                    return None # Or raise a custom exception
-                elif response.status_code == 403:
-                    logging.error(f"Forbidden: {http_err} at URL: {url}, with response: {response.content}")
-                    return None # Or raise a custom exception
-                elif response.status_code == 404:
-                    logging.error(f"Not found: {http_err} at URL: {url}, with response: {response.content}")
-                    return None # Or raise a custom exception
-                else:
-                    logging.error(f"An HTTP error occurred: {http_err} at URL: {url}, with response: {response.content}")
-                    return None  # Or raise a custom exception
-            except requests.RequestException as req_err:
-                logging.error(f"A request error occurred: {req_err} at URL: {url}")
-                return None
-            except json.JSONDecodeError as json_err:
-                logging.error(f"Failed to decode JSON: {json_err} at URL: {url}, with response: {response.content}")
-                return None
-        logging.error(f"Max retries exceeded for {method} {url}")
-        return None  # Or raise an exception after max retries
+        try:
+            response = {}
+            if method == "GET":
+                headers = self.get_authorization_header(method, path, body_bytes, self._get_current_timestamp())
+                response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            elif method == "POST":
+                response = self._post(url, path, body_bytes)
+            response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return response.json()
+        except requests.exceptions.HTTPError as http_err:
+            description = _STATUS_DESCRIPTION.get(response.status_code, "An HTTP error occurred")
+            logging.error(f"{description}: {http_err} at URL: {url}, with response: {response.content}")
+            return None  # Or raise a custom exception
+        except requests.RequestException as req_err:
+            logging.error(f"A request error occurred: {req_err} at URL: {url}")
+            return None
+        except json.JSONDecodeError as json_err:
+            logging.error(f"Failed to decode JSON: {json_err} at URL: {url}, with response: {response.content}")
+            return None
+
+    def _post(self, url: str, path: str, body_bytes: bytes) -> requests.Response:
+        """
+        Sends a signed POST, resending it only while it is rate limited (429). Each attempt is
+        re-signed so its timestamp is current, and waits for Retry-After when the API sends it.
+
+        Args:
+            url: The full request URL.
+            path: The API endpoint path, as signed.
+            body_bytes: The serialized request body.
+
+        Returns:
+            The last response received.
+        """
+        delay = 0.5
+        for attempt in range(POST_RATE_LIMIT_ATTEMPTS):
+            headers = self.get_authorization_header("POST", path, body_bytes, self._get_current_timestamp())
+            headers["Content-Type"] = "application/json"
+            response = self.session.post(url, headers=headers, data=body_bytes, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 429 or attempt == POST_RATE_LIMIT_ATTEMPTS - 1:
+                return response
+            retry_after = response.headers.get("Retry-After", "")
+            wait = float(retry_after) if retry_after.isdigit() else delay
+            logging.warning(f"Rate limited on attempt {attempt + 1}/{POST_RATE_LIMIT_ATTEMPTS} at URL: {url}. "
+                            f"Retrying in {wait} seconds...")
+            time.sleep(wait)
+            delay *= 2
+        return response
+
+    def _sign(self, message: bytes) -> bytes:
+        """Returns the 64-byte Ed25519 signature of message."""
+        if self._secret_key is not None:
+            # crypto_sign returns signature + message; the signature is the prefix
+            return crypto_sign(message, self._secret_key)[:crypto_sign_BYTES]
+        return self.private_key.sign(message)
 
     def get_authorization_header(
-            self, method: str, path: str, body: str, timestamp: int
+            self, method: str, path: str, body: Union[str, bytes], timestamp: int
     ) -> Dict[str, str]:
         """
         Generates the authorization header for Robinhood API requests.
@@ -97,11 +170,13 @@ class APIClient:
         Returns:
             The authorization header as a dictionary.
         """
-        message_to_sign = f"{self.api_key}{timestamp}{path}{method}{body}"
-        signature = self.private_key.sign(message_to_sign.encode("utf-8"))
-
-        return {
-            "x-api-key": self.api_key,
-            "x-signature": base64.b64encode(signature).decode("utf-8"),
-            "x-timestamp": str(timestamp),
-        }
\ No newline at end of file
+        message_to_sign = b"%b%d%b%b%b" % (
+            self._api_key_bytes, timestamp, path.encode("utf-8"), method.encode("utf-8"),
+            body if isinstance(body, bytes) else body.encode("utf-8"),
+        )
+        signature = self._sign(message_to_sign)
+
+        headers = self._header_template.copy()
+        headers["x-signature"] = base64.b64encode(signature).decode("utf-8")
+        headers["x-timestamp"] = str(timestamp)
+        return headers
\ No newline at end of file
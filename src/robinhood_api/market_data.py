@@ -1,12 +1,92 @@
-from typing import Any, Optional
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 from src.robinhood_api.api_client import APIClient
 
+# Robinhood's stated spread is 0.60%: buys ('ask') pay it on top, sells ('bid') give it up
+_SPREAD_MULT = {"ask": 1 + 0.006, "bid": 1 - 0.006}
+
+
+class _TTLCache:
+    """
+    Thread-safe cache whose entries expire a fixed number of seconds after being stored.
+    """
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Returns the cached value for key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        return entry[1]
+
+    def set(self, key: Any, value: Any):
+        """Stores value under key, dropping expired entries once the cache is full."""
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.maxsize:
+                self._entries = {k: v for k, v in self._entries.items() if now - v[0] < self.ttl}
+            self._entries[key] = (now, value)
+
+
+class _SingleFlight:
+    """
+    Coalesces concurrent identical calls: while a call for a key is in flight, other threads asking
+    for the same key wait for its result instead of issuing their own request.
+    """
+    def __init__(self):
+        self._inflight: Dict[Any, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Any, fn: Callable[[], Any]) -> Any:
+        """Runs fn for key unless a call for key is already running, in which case its result is shared."""
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+
 class MarketData:
     """
     Handles market data retrieval from Robinhood.
     """
-    def __init__(self, api_client: APIClient):
+    def __init__(self, api_client: APIClient, price_ttl: float = 5.0, quote_ttl: float = 1.0,
+                 trading_pairs_ttl: float = 86400.0):
+        """
+        Args:
+            api_client: The API client used for requests.
+            price_ttl: Seconds an adjusted estimated price is reused before it is fetched again.
+            quote_ttl: Seconds a best bid/ask response is reused before it is fetched again.
+            trading_pairs_ttl: Seconds trading pair metadata is reused before it is fetched again.
+        """
         self.api_client = api_client
+        self._price_cache = _TTLCache(price_ttl)
+        self._quote_cache = _TTLCache(quote_ttl)
+        self._trading_pairs_cache = _TTLCache(trading_pairs_ttl, maxsize=256)
+        self._single_flight = _SingleFlight()
 
     def get_trading_pairs(self, *symbols: Optional[str]) -> Any:
         """
@@ -18,10 +98,19 @@ class MarketData:
         Returns:
             The trading pairs from the API or None on error.
         """
+        # Pair metadata changes on the order of days, so reuse recent responses
+        cache_key = tuple(sorted(symbols))
+        cached_response = self._trading_pairs_cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+
         path = "/api/v1/crypto/trading/trading_pairs/"
         if symbols:
-            path += "?" + "&".join(f"symbol={arg}" for arg in symbols)
-        return self.api_client.make_api_request("GET", path)
+            path += "?" + urlencode([("symbol", arg) for arg in symbols])
+        response = self.api_client.make_api_request("GET", path)
+        if response is not None:
+            self._trading_pairs_cache.set(cache_key, response)
+        return response
 
     def get_best_bid_ask(self, *symbols: Optional[str]) -> Any:
         """
@@ -33,10 +122,44 @@ class MarketData:
         Returns:
             The best bid/ask prices from the API or None on error.
         """
+        # Collapse repeated requests for the same symbols within a short window
+        cache_key = tuple(sorted(symbols))
+        cached_response = self._quote_cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+
         path = "/api/v1/crypto/marketdata/best_bid_ask/"
         if symbols:
-            path += "?" + "&".join(f"symbol={arg}" for arg in symbols)
-        return self.api_client.make_api_request("GET", path)
+            path += "?" + urlencode([("symbol", arg) for arg in symbols])
+
+        def fetch():
+            response = self.api_client.make_api_request("GET", path)
+            if response is not None:
+                self._quote_cache.set(cache_key, response)
+            return response
+
+        # Concurrent callers asking for the same symbols share one request
+        return self._single_flight.do(("best_bid_ask", cache_key), fetch)
+
+    def get_best_bid_ask_batch(self, symbols: List[str]) -> Dict[str, dict]:
+        """
+        Gets the best bid/ask quotes for several symbols with a single request.
+
+        Args:
+            symbols: The trading pair symbols (e.g., ["BTC-USD", "ETH-USD"]).
+
+        Returns:
+            The quote results keyed by symbol. Symbols missing from the API response are omitted.
+        """
+        if not symbols:
+            return {}
+        response = self.get_best_bid_ask(*symbols)
+
+        # Handle missing or invalid response
+        if not response or "results" not in response:
+            return {}
+
+        return {result["symbol"]: result for result in response["results"]}
 
     def get_estimated_price(self, symbol: str, side: str, quantity: float) -> Any:
         """
@@ -81,29 +204,77 @@ class MarketData:
         if not isinstance(quantity, float) or quantity <= 0:
             raise ValueError("quantity must be a positive float.")
 
+        # Reuse a recent price for the same request if one is cached
+        cache_key = (symbol, side, quantity)
+        cached_price = self._price_cache.get(cache_key)
+        if cached_price is not None:
+            return cached_price
+
         # Build the API path (adjust for your actual endpoint)
         path = f"/api/v1/crypto/marketdata/estimated_price/?symbol={symbol}&side={side}&quantity={quantity}"
-        response = self.api_client.make_api_request("GET", path)
 
-        # Handle missing or invalid response
-        if not response or "results" not in response or not response["results"]:
-            return None
+        def fetch():
+            response = self.api_client.make_api_request("GET", path)
+
+            # Handle missing or invalid response
+            if not response or "results" not in response or not response["results"]:
+                return None
+
+            # Convert estimated price to float
+            estimated_price = float(response["results"][0]["price"])
+
+            adjusted_price = self._adjust_for_spread(estimated_price, side)
+            self._price_cache.set(cache_key, adjusted_price)
+            return adjusted_price
+
+        # Concurrent callers asking for the same price share one request
+        return self._single_flight.do(("estimated_price", cache_key), fetch)
+
+    def get_adj_est_prices(self, symbols: List[str], side: str) -> Dict[str, float]:
+        """
+        Gets spread-adjusted prices for several symbols with a single best bid/ask request,
+        instead of one estimated_price round-trip per symbol.
+
+        Args:
+            symbols (List[str]): The trading pair symbols (e.g., ["BTC-USD", "ETH-USD"]).
+            side (str): 'bid' (sell) or 'ask' (buy).
+
+        Returns:
+            Dict[str, float]: Adjusted price keyed by symbol. Symbols missing from the
+                              API response are omitted.
+        """
+        if side not in ["bid", "ask"]:
+            raise ValueError("side must be 'bid' or 'ask'.")
 
-        # Convert estimated price to float
-        estimated_price = float(response["results"][0]["price"])
+        quotes = self.get_best_bid_ask_batch(symbols)
+        return {symbol: self.get_adj_price_from_quote(quote, side) for symbol, quote in quotes.items()}
+
+    @classmethod
+    def get_adj_price_from_quote(cls, quote: dict, side: str) -> float:
+        """
+        Computes the spread-adjusted price from a best bid/ask quote, so callers that
+        already hold a quote don't need a separate estimated_price request.
+
+        Args:
+            quote (dict): A single result from the best bid/ask endpoint.
+            side (str): 'bid' (sell) or 'ask' (buy).
 
-        # Robinhood's stated spread is 0.60% (0.006 in decimal)
-        spread_percentage = 0.006
+        Returns:
+            float: The quote price adjusted for Robinhood's spread.
+        """
+        return cls._adjust_for_spread(float(quote["price"]), side)
 
-        # If side == 'ask' => buy => price includes buy spread
-        # If side == 'bid' => sell => price includes sell spread
-        if side == "ask":
-            # Adjust upwards for buy spread
-            adjusted_price = estimated_price * (1 + spread_percentage)
-        else:  # side == "bid"
-            # Adjust downwards for sell spread
-            adjusted_price = estimated_price * (1 - spread_percentage)
+    @staticmethod
+    def _adjust_for_spread(price: float, side: str) -> float:
+        """
+        Adjusts a price for Robinhood's 0.60% spread on the given side.
 
-        adjusted_price = round(adjusted_price, 2) # Robinhood rounds to the nearest cent
+        Args:
+            price (float): The unadjusted price.
+            side (str): 'bid' (sell) or 'ask' (buy).
 
-        return adjusted_price
\ No newline at end of file
+        Returns:
+            float: The adjusted price, rounded to the nearest cent.
+        """
+        adjusted_price = price * _SPREAD_MULT[side]
+        return round(adjusted_price, 2)  # Robinhood rounds to the nearest cent
\ No newline at end of file
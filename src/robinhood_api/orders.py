@@ -1,8 +1,24 @@
 from typing import Any, Optional
-import json
+from collections import OrderedDict
 from src.robinhood_api.api_client import APIClient
+import threading
 import uuid
 
+# Accepted values for order fields, checked on every order placement
+_SIDES = frozenset({"buy", "sell"})
+# Order type -> body key holding that type's configuration (e.g. 'market_order_config')
+_ORDER_CONFIG_KEYS = {
+    order_type: f"{order_type}_order_config"
+    for order_type in ("market", "limit", "stop_loss", "stop_limit")
+}
+_TIME_IN_FORCE = frozenset({"gtc", "gfd"})
+
+# Order states that never change again, so their responses can be cached
+_TERMINAL_STATES = frozenset({"filled", "canceled", "failed"})
+
+# Maximum number of terminal-state orders kept by get_order's cache
+ORDER_CACHE_SIZE = 1024
+
 class Orders:
     """
     Handles order-related operations with Robinhood.
@@ -10,6 +26,9 @@ class Orders:
 
     def __init__(self, api_client: APIClient):
         self.api_client = api_client
+        # LRU cache of terminal-state order responses keyed by order id
+        self._order_cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._order_cache_lock = threading.Lock()
 
     def _place_order(self, side: str, order_type: str, symbol: str, quantity: float, order_config: dict) -> Any:
         """
@@ -26,13 +45,14 @@ class Orders:
             The order response from the API or None on error.
         """
         client_order_id = str(uuid.uuid4())  # Generate a unique client_order_id
-        if not isinstance(side, str) or side not in ["buy", "sell"]:
+        if side not in _SIDES:
             raise ValueError("side must be 'buy' or 'sell'.")
-        if not isinstance(order_type, str) or order_type not in ["market", "limit", "stop_loss", "stop_limit"]:
+        config_key = _ORDER_CONFIG_KEYS.get(order_type)
+        if config_key is None:
             raise ValueError("order_type must be one of 'market', 'limit', 'stop_loss', 'stop_limit'.")
-        if not isinstance(symbol, str) or not symbol:
+        if not symbol or not isinstance(symbol, str):
             raise ValueError("symbol must be a non-empty string.")
-        if not isinstance(quantity, float) or quantity <= 0:
+        if not _is_positive_number(quantity):
             raise ValueError("quantity must be a positive number.")
 
         body = {
@@ -40,10 +60,10 @@ class Orders:
             "side": side,
             "type": order_type,
             "symbol": symbol,
-            f"{order_type}_order_config": order_config,
+            config_key: order_config,
         }
         path = "/api/v1/crypto/trading/orders/"
-        response = self.api_client.make_api_request("POST", path, json.dumps(body))
+        response = self.api_client.make_api_request("POST", path, body)
         return response, client_order_id
 
     def place_market_order(self, symbol: str, side: str, quantity: float,
@@ -60,10 +80,10 @@ class Orders:
         Returns:
             The order response from the API and the client_order_id.
         """
-        if time_in_force not in ["gtc", "gfd"]:
+        if time_in_force not in _TIME_IN_FORCE:
             raise ValueError("time_in_force must be one of 'gtc' or 'gfd'.")
 
-        order_config = {"asset_quantity": quantity, "time_in_force": time_in_force}
+        order_config = {"asset_quantity": float(quantity), "time_in_force": time_in_force}
         return self._place_order(side, "market", symbol, quantity, order_config)
 
     def place_limit_order(self, symbol: str, side: str, quantity: float, limit_price: float, time_in_force: Optional[str] = "gtc") -> Any:
@@ -80,12 +100,12 @@ class Orders:
         Returns:
              The order response from the API and the client_order_id
         """
-        if not isinstance(limit_price, float) or limit_price <= 0:
+        if not _is_positive_number(limit_price):
             raise ValueError("limit_price must be a positive number for limit orders.")
-        if time_in_force not in ["gtc", "gfd"]:
+        if time_in_force not in _TIME_IN_FORCE:
             raise ValueError("time_in_force must be one of 'gtc', 'gfd'.")
 
-        order_config = {"quantity": quantity, "limit_price": limit_price, "time_in_force": time_in_force}
+        order_config = {"quantity": float(quantity), "limit_price": float(limit_price), "time_in_force": time_in_force}
         return self._place_order(side, "limit", symbol, quantity, order_config)
 
     def place_stop_loss_order(self, symbol: str, side: str, quantity: float, stop_price: float, time_in_force: Optional[str] = "gtc") -> Any:
@@ -102,12 +122,12 @@ class Orders:
         Returns:
             The order response from the API and the client_order_id
         """
-        if not isinstance(stop_price, float) or stop_price <= 0:
+        if not _is_positive_number(stop_price):
             raise ValueError("stop_price must be a positive number for stop orders.")
-        if time_in_force not in ["gtc", "gfd"]:
+        if time_in_force not in _TIME_IN_FORCE:
             raise ValueError("time_in_force must be one of 'gtc', 'gfd'.")
 
-        order_config = {"quantity": quantity, "stop_price": stop_price, "time_in_force": time_in_force}
+        order_config = {"quantity": float(quantity), "stop_price": float(stop_price), "time_in_force": time_in_force}
         return self._place_order(side, "stop_loss", symbol, quantity, order_config)
 
     def cancel_order(self, order_id: str) -> Any:
@@ -137,8 +157,22 @@ class Orders:
         """
         if not isinstance(order_id, str):
             raise ValueError("order_id must be a string.")
+        with self._order_cache_lock:
+            cached_order = self._order_cache.get(order_id)
+            if cached_order is not None:
+                self._order_cache.move_to_end(order_id)
+                return cached_order
+
         path = f"/api/v1/crypto/trading/orders/{order_id}/"
-        return self.api_client.make_api_request("GET", path)
+        response = self.api_client.make_api_request("GET", path)
+
+        # Filled, canceled and failed orders are immutable; skip the network next time
+        if response and response.get("state") in _TERMINAL_STATES:
+            with self._order_cache_lock:
+                self._order_cache[order_id] = response
+                if len(self._order_cache) > ORDER_CACHE_SIZE:
+                    self._order_cache.popitem(last=False)
+        return response
 
     def get_orders(self) -> Any:
         """
@@ -148,4 +182,17 @@ class Orders:
             All the order information from the API or None on error.
         """
         path = "/api/v1/crypto/trading/orders/"
-        return self.api_client.make_api_request("GET", path)
\ No newline at end of file
+        return self.api_client.make_api_request("GET", path)
+
+
+def _is_positive_number(value: Any) -> bool:
+    """
+    Checks that a quantity or price is a positive int or float, including numpy floats (bools are rejected).
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        True if the value is a positive number, otherwise False.
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
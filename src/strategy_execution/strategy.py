@@ -2,6 +2,9 @@
 
 import numpy as np
 
+# Market data keys fed to the model, in column order
+FEATURE_NAMES = ("feature1", "feature2")
+
 
 class Strategy:
     def __init__(self, symbol, model, portfolio_value, max_capital_allocation=0.2, risk_per_trade=0.02,
@@ -26,6 +29,9 @@ class Strategy:
         # Track daily loss
         self.daily_loss = 0.0
 
+        # Reused model input row, overwritten in place on every prediction
+        self._feature_buffer = np.empty((1, len(FEATURE_NAMES)), dtype=np.float64)
+
     def calculate_position_size(self, entry_price):
         """
         Calculate the max position size for each trade based on the maximum loss per trade
@@ -56,13 +62,14 @@ class Strategy:
         :param market_data: Dictionary containing relevant market indicators (features)
         :return: True if entry conditions are met, else False
         """
-        # Convert market data into model input format
-        model_input = np.array([market_data["feature1"], market_data["feature2"]]).reshape(1, -1)
+        # Write market data into the preallocated model input row
+        for i, name in enumerate(FEATURE_NAMES):
+            self._feature_buffer[0, i] = market_data[name]
 
         # Predict using model (binary classification: 1 = Buy, 0 = No action)
-        prediction = self.model.predict(model_input)
+        prediction = self.model.predict(self._feature_buffer)[0]
 
-        return prediction == 1  # If model predicts 1, enter a trade
+        return bool(prediction == 1)  # If model predicts 1, enter a trade
 
     def get_entry_details(self, market_data) -> dict:
         """
@@ -111,4 +118,46 @@ class Strategy:
         if self.daily_loss < -self.daily_loss_limit * self.portfolio_value:
             logging.warning("Daily loss limit reached. No more trades for today.")
             return False  # Stop trading for the day
-        return True  # Continue trading
\ No newline at end of file
+        return True  # Continue trading
+
+
+class StrategyBatch:
+    def __init__(self, strategies):
+        """
+        Groups per-symbol strategies so their entry decisions are made with one model call per model.
+
+        :param strategies: List of Strategy instances (one per symbol)
+        """
+        self.strategies = list(strategies)
+
+        # Strategies that share a model are predicted together
+        self._groups = {}
+        for strategy in self.strategies:
+            self._groups.setdefault(id(strategy.model), []).append(strategy)
+
+    def decide(self, all_market_data) -> dict:
+        """
+        Determines whether each strategy should enter a trade, stacking every symbol's features into
+        a single (K, N) model input instead of making K separate predictions.
+
+        :param all_market_data: Dictionary mapping symbol to its market data dictionary
+        :return: Dictionary mapping symbol to True if entry conditions are met, else False
+        """
+        decisions = {}
+        for strategies in self._groups.values():
+            active = [strategy for strategy in strategies if strategy.symbol in all_market_data]
+            if not active:
+                continue
+
+            model_input = np.empty((len(active), len(FEATURE_NAMES)), dtype=np.float64)
+            for row, strategy in enumerate(active):
+                market_data = all_market_data[strategy.symbol]
+                for col, name in enumerate(FEATURE_NAMES):
+                    model_input[row, col] = market_data[name]
+
+            # Predict using the shared model (binary classification: 1 = Buy, 0 = No action)
+            predictions = active[0].model.predict(model_input)
+
+            for strategy, prediction in zip(active, predictions):
+                decisions[strategy.symbol] = bool(prediction == 1)
+        return decisions
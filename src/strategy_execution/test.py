@@ -1,11 +1,60 @@
 import asyncio
 import random
 import logging
+from typing import Optional, Tuple
 from trade import TrackedTrade, TradeStatus
 from trade_manager import TradeManager
 from src.robinhood_api.api_access import CryptoAPITrading
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Backoff schedule (seconds) between sell fill checks; the last delay repeats until the order fills
+FILL_POLL_DELAYS = (0.05, 0.1, 0.2, 0.5, 1.0)
+
+# Fallback re-check interval (seconds) for a monitor idling with no trades to watch
+IDLE_TIMEOUT = 30.0
+
+# Adaptive monitor polling (seconds): reset to the base interval after a state change, otherwise
+# grow by the backoff factor up to the cap. Exits are price-driven, so open trades keep a tighter cap.
+MONITOR_BASE_SLEEP = 1.0
+MONITOR_BACKOFF = 1.5
+PENDING_MONITOR_MAX_SLEEP = 30.0
+OPEN_MONITOR_MAX_SLEEP = 5.0
+
+async def wait_for_trades(event: asyncio.Event, timeout: float = IDLE_TIMEOUT) -> bool:
+    """
+    Blocks a monitor until a trade is added (the event is set) or the timeout passes.
+    Returns True if a new trade woke the monitor. The monitor clears the event itself when it
+    snapshots its trades, so a trade added while it was busy still wakes it immediately.
+    """
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+def next_monitor_interval(interval: float, changed: bool, max_sleep: float) -> float:
+    """
+    Returns the next monitor polling interval: the base interval after a state change, otherwise backed off.
+    """
+    if changed:
+        return MONITOR_BASE_SLEEP
+    return min(interval * MONITOR_BACKOFF, max_sleep)
+
+def parse_fill_price(order_details) -> Optional[float]:
+    """
+    Returns the effective price of an order's first execution, or None if it has not filled yet.
+    """
+    if not order_details:
+        return None
+    executions = order_details.get('executions')
+    if not executions:
+        return None
+    return float(executions[0]['effective_price'])
+
+def parse_best_bid_ask(quote) -> Tuple[float, float]:
+    """
+    Returns (best_bid, best_ask) from a best bid/ask quote, both inclusive of Robinhood's spread.
+    """
+    return float(quote['bid_inclusive_of_sell_spread']), float(quote['ask_inclusive_of_buy_spread'])
 
 async def place_order(api_trading_client, symbol, quantity, side):
     """
@@ -13,124 +62,188 @@ async def place_order(api_trading_client, symbol, quantity, side):
     Returns the order_id and best bid/ask at submission.
     Does NOT wait for the order to fill.
     """
+    market_data = api_trading_client.market_data
     try:
-        # Step 1: Get the adjusted estimated price
-        adj_est_price = api_trading_client.market_data.get_adj_est_price(
-            symbol=symbol,
-            side=('ask' if side == 'buy' else 'bid'),
-            quantity=quantity
-        )
-        # Step 2: Get best bid/ask
-        best_bid_ask = api_trading_client.market_data.get_best_bid_ask(symbol)
-        best_bid = float(best_bid_ask['results'][0]['bid_inclusive_of_sell_spread'])
-        best_ask = float(best_bid_ask['results'][0]['ask_inclusive_of_buy_spread'])
-        logging.info(
-            f"Submitting Market {side.capitalize()} Order for {symbol} with adj_est_price={adj_est_price:.6f}"
-        )
-        # Step 3: Place market order
-        order_result = api_trading_client.orders.place_market_order(
-            symbol=symbol,
-            side=side,
-            quantity=quantity
+        # The order doesn't depend on the quote (it is only recorded for slippage analysis),
+        # so submit the order and fetch best bid/ask concurrently.
+        logging.info("Submitting Market %s Order for %s", side.capitalize(), symbol)
+        order_result, quotes = await asyncio.gather(
+            asyncio.to_thread(
+                api_trading_client.orders.place_market_order,
+                symbol=symbol,
+                side=side,
+                quantity=quantity
+            ),
+            asyncio.to_thread(market_data.get_best_bid_ask_batch, [symbol]),
+            return_exceptions=True
         )
+        if isinstance(order_result, Exception):
+            raise order_result
         order_id = order_result[0]['id']
-        return order_id, best_bid, best_ask, adj_est_price
     except Exception as e:
-        logging.error(f"Error placing {side} order: {e}")
+        logging.error("Error placing %s order: %s", side, e)
         return None, None, None, None
 
+    # The order is already live, so a failed quote lookup must not lose its id
+    if isinstance(quotes, Exception) or symbol not in quotes:
+        logging.warning("Best bid/ask unavailable when submitting order %s, retrying quote.", order_id)
+        try:
+            quotes = await asyncio.to_thread(market_data.get_best_bid_ask_batch, [symbol])
+        except Exception as e:
+            logging.error("Error fetching best bid/ask for %s: %s", symbol, e)
+            quotes = {}
+    quote = quotes.get(symbol)
+    if quote is None:
+        nan = float("nan")
+        return order_id, nan, nan, nan
+
+    # Derive the adjusted estimated price from the same quote rather than making a
+    # second request to the estimated_price endpoint
+    best_bid, best_ask = parse_best_bid_ask(quote)
+    adj_est_price = market_data.get_adj_price_from_quote(quote, 'ask' if side == 'buy' else 'bid')
+    logging.info("Order %s for %s submitted with adj_est_price=%.6f", order_id, symbol, adj_est_price)
+    return order_id, best_bid, best_ask, adj_est_price
+
 async def monitor_pending_trades(api_trading_client, trade_manager: TradeManager):
+    pending_trades, open_trades = trade_manager.pending_trades, trade_manager.open_trades
+    interval = MONITOR_BASE_SLEEP
     while True:
-        pending_trades, open_trades = trade_manager.load_trades()
-        updated = False
-        for trade in pending_trades[:]:
-            if trade.status == TradeStatus.PENDING:
-                order_details = api_trading_client.orders.get_order(trade.buy_order_id)
-                if order_details and order_details.get('executions'):
-                    execution_price = float(order_details['executions'][0]['effective_price'])
+        # Clear before snapshotting: a trade added from here on sets the event again and cuts the wait short
+        trade_manager.pending_nonempty.clear()
+        if not pending_trades:
+            await wait_for_trades(trade_manager.pending_nonempty)
+            interval = MONITOR_BASE_SLEEP
+            continue
+        changed = False
+        pending = [(oid, trade) for oid, trade in pending_trades.items() if trade.status == TradeStatus.PENDING]
+        # Check every pending order concurrently: one round-trip per tick instead of one per trade
+        results = await asyncio.gather(
+            *(asyncio.to_thread(api_trading_client.orders.get_order, trade.buy_order_id) for _, trade in pending),
+            return_exceptions=True
+        )
+        for (oid, trade), order_details in zip(pending, results):
+            if isinstance(order_details, Exception):
+                logging.error("[PendingMonitor] Error fetching buy order %s: %s", trade.buy_order_id, order_details)
+                continue
+            execution_price = parse_fill_price(order_details)
+            if execution_price is not None:
+                async with trade_manager.lock:
                     trade.buy_price = execution_price  # record actual fill price
                     trade.status = TradeStatus.OPEN
-                    logging.info(
-                        f"[PendingMonitor] Buy order filled for {trade.symbol} at price={execution_price:.6f}, transitioning to OPEN."
-                    )
-                    pending_trades.remove(trade)
-                    open_trades.append(trade)
-                    updated = True
-                    # Once one trade is processed, break to re‑load updated state
-                    break
-        if updated:
-            trade_manager.save_trades(pending_trades, open_trades)
-        await asyncio.sleep(1)
+                    del pending_trades[oid]
+                    open_trades[oid] = trade
+                    trade_manager.append_event(trade)
+                changed = True
+                logging.info(
+                    "[PendingMonitor] Buy order filled for %s at price=%.6f, transitioning to OPEN.",
+                    trade.symbol, execution_price
+                )
+        interval = next_monitor_interval(interval, changed, PENDING_MONITOR_MAX_SLEEP)
+        logging.debug("[PendingMonitor] Next check in %.2f seconds", interval)
+        if await wait_for_trades(trade_manager.pending_nonempty, interval):
+            interval = MONITOR_BASE_SLEEP
 
 async def monitor_open_trades(api_trading_client, trade_manager: TradeManager):
     """
-    Continuously monitors open trades (from CSV) for exit conditions.
+    Continuously monitors the in-memory open trades for exit conditions.
     When conditions are met, submits a sell order and polls for fill.
     """
+    open_trades = trade_manager.open_trades
+    interval = MONITOR_BASE_SLEEP
     while True:
-        pending_trades, open_trades = trade_manager.load_trades()
-        for trade in open_trades[:]:
-            if trade.status == TradeStatus.OPEN and not trade.is_closed():
-                adj_est_price = api_trading_client.market_data.get_adj_est_price(
-                    symbol=trade.symbol,
+        # Clear before snapshotting: a trade added from here on sets the event again and cuts the wait short
+        trade_manager.open_nonempty.clear()
+        if not open_trades:
+            await wait_for_trades(trade_manager.open_nonempty)
+            interval = MONITOR_BASE_SLEEP
+            continue
+        changed = False
+        candidates = [trade for trade in open_trades.values() if trade.status == TradeStatus.OPEN and not trade.is_closed()]
+        # Price each distinct (symbol, quantity) once, concurrently, before evaluating exits;
+        # trades on the same symbol and size share one request
+        price_keys = list({(trade.symbol, trade.quantity) for trade in candidates})
+        prices = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    api_trading_client.market_data.get_adj_est_price,
+                    symbol=symbol,
                     side='bid',
-                    quantity=trade.quantity
+                    quantity=quantity
                 )
-                if adj_est_price < trade.buy_price:
-                    logging.info(
-                        f"[OpenMonitor] Sell condition met for {trade.symbol}: adj_est_price={adj_est_price:.6f} < buy_price={trade.buy_price:.6f}"
-                    )
-                    sell_id, best_bid_sell, best_ask_sell, sell_adj_est_price = await place_order(
-                        api_trading_client, trade.symbol, trade.quantity, 'sell'
-                    )
-                    if sell_id:
+                for symbol, quantity in price_keys
+            ),
+            return_exceptions=True
+        )
+        price_by_key = dict(zip(price_keys, prices))
+        for trade in candidates:
+            adj_est_price = price_by_key[(trade.symbol, trade.quantity)]
+            if isinstance(adj_est_price, Exception) or adj_est_price is None:
+                logging.error("[OpenMonitor] Could not price %s: %s", trade.symbol, adj_est_price)
+                continue
+            if adj_est_price < trade.buy_price:
+                logging.info(
+                    "[OpenMonitor] Sell condition met for %s: adj_est_price=%.6f < buy_price=%.6f",
+                    trade.symbol, adj_est_price, trade.buy_price
+                )
+                sell_id, best_bid_sell, best_ask_sell, sell_adj_est_price = await place_order(
+                    api_trading_client, trade.symbol, trade.quantity, 'sell'
+                )
+                if sell_id:
+                    async with trade_manager.lock:
                         trade.sell_order_id = sell_id
                         trade.best_bid_sell = best_bid_sell  # Store best bid at sell order placement
                         trade.best_ask_sell = best_ask_sell  # Store best ask at sell order placement
                         trade.estimated_price_sell = sell_adj_est_price  # Store estimated price at sell order placement
 
-                        # Save trade state after placing the sell order
-                        trade_manager.save_trades(pending_trades, open_trades)
+                        # Journal trade state after placing the sell order
+                        trade_manager.append_event(trade)
 
-                        await poll_for_sell_fill(api_trading_client, trade, trade_manager)
-                        open_trades.remove(trade)
-                        trade_manager.save_trades(pending_trades, open_trades)
-                else:
-                    logging.info(
-                        f"[OpenMonitor] Sell condition NOT met for {trade.symbol}: adj_est_price={adj_est_price:.6f}, buy_price={trade.buy_price:.6f}"
-                    )
-                    await asyncio.sleep(2)
-        await asyncio.sleep(1)
+                    await poll_for_sell_fill(api_trading_client, trade, trade_manager)
+                    changed = True
+            else:
+                logging.info(
+                    "[OpenMonitor] Sell condition NOT met for %s: adj_est_price=%.6f, buy_price=%.6f",
+                    trade.symbol, adj_est_price, trade.buy_price
+                )
+        interval = next_monitor_interval(interval, changed, OPEN_MONITOR_MAX_SLEEP)
+        logging.debug("[OpenMonitor] Next check in %.2f seconds", interval)
+        if await wait_for_trades(trade_manager.open_nonempty, interval):
+            interval = MONITOR_BASE_SLEEP
 
 async def poll_for_sell_fill(api_trading_client, trade, trade_manager: TradeManager):
     """
     Polls until the sell order is filled, then closes the trade and logs it.
+    Market orders usually fill within milliseconds, so polling starts fast and backs off.
     """
+    attempt = 0
     while True:
-        sell_details = api_trading_client.orders.get_order(trade.sell_order_id)
-        if sell_details and sell_details.get('executions'):
-            sell_price = float(sell_details['executions'][0]['effective_price'])
-            trade.close_trade(
-                sell_order_id=trade.sell_order_id,
-                sell_price=sell_price,
-                best_bid=trade.best_bid_sell,  # Use the stored sell order best bid
-                best_ask=trade.best_ask_sell,  # Use the stored sell order best ask
-                estimated_price=trade.estimated_price_sell  # Use the stored estimated price at sell order
-            )
-            trade.status = TradeStatus.CLOSED
+        await asyncio.sleep(FILL_POLL_DELAYS[min(attempt, len(FILL_POLL_DELAYS) - 1)])
+        attempt += 1
+        sell_details = await asyncio.to_thread(api_trading_client.orders.get_order, trade.sell_order_id)
+        sell_price = parse_fill_price(sell_details)
+        if sell_price is not None:
+            async with trade_manager.lock:
+                trade.close_trade(
+                    sell_order_id=trade.sell_order_id,
+                    sell_price=sell_price,
+                    best_bid=trade.best_bid_sell,  # Use the stored sell order best bid
+                    best_ask=trade.best_ask_sell,  # Use the stored sell order best ask
+                    estimated_price=trade.estimated_price_sell  # Use the stored estimated price at sell order
+                )
+                trade.status = TradeStatus.CLOSED
+                trade_manager.log_trade(trade)
+                # The closed trade now lives only in the log; drop it from the open trades
+                trade_manager.open_trades.pop(trade.buy_order_id, None)
+                trade_manager.append_event(trade)
             logging.info(
-                f"[SellFillMonitor] Sell order filled for {trade.symbol} at price={sell_price:.6f}. Trade closed."
+                "[SellFillMonitor] Sell order filled for %s at price=%.6f. Trade closed.", trade.symbol, sell_price
             )
-            trade_manager.log_trade(trade)
-            pending_trades, open_trades = trade_manager.load_trades()
-            trade_manager.save_trades(pending_trades, open_trades)
             return
-        await asyncio.sleep(1)
 
 async def buy_trades_loop(api_trading_client, trade_manager: TradeManager, symbol='DOGE-USD', quantity=1.0, interval_seconds=10):
     """
     Places buy orders based on a schedule.
-    Each new buy order is added to the CSV as a PENDING trade.
+    Each new buy order is added as a PENDING trade and journaled.
     """
     while True:
         buy_id, best_bid, best_ask, adj_est_price = await place_order(
@@ -147,27 +260,37 @@ async def buy_trades_loop(api_trading_client, trade_manager: TradeManager, symbo
                 estimated_price=adj_est_price,
                 status=TradeStatus.PENDING
             )
-            pending_trades, open_trades = trade_manager.load_trades()
-            pending_trades.append(new_trade)
-            trade_manager.save_trades(pending_trades, open_trades)
+            async with trade_manager.lock:
+                trade_manager.pending_trades[buy_id] = new_trade
+                trade_manager.append_event(new_trade)
         sleepy_time = interval_seconds + random.uniform(120, 600)
-        logging.info(f"[BuyLoop] Sleeping for {sleepy_time:.2f} seconds before next buy...")
+        logging.info("[BuyLoop] Sleeping for %.2f seconds before next buy...", sleepy_time)
         await asyncio.sleep(sleepy_time)
 
-async def main_trading(api_trading_client):
+async def main_trading(api_trading_client, symbols=('DOGE-USD',), quantity=1.0):
     """
     Main execution loop.
-    Loads the persistent trade state from CSV and launches the buy, pending, and open monitors concurrently.
+    Loads the persistent trade state (state snapshot plus journal) and launches a buy loop per symbol plus the pending
+    and open monitors concurrently. Every symbol is scheduled on this one event loop, so adding
+    symbols adds coroutines rather than threads.
     """
+    # Creates the trade log if needed and loads the initial state into memory.
     trade_manager = TradeManager()
-    # Ensure the CSV exists and load the initial state.
-    trade_manager.load_trades()
-    buy_task = asyncio.create_task(buy_trades_loop(api_trading_client, trade_manager))
+    buy_tasks = [
+        asyncio.create_task(buy_trades_loop(api_trading_client, trade_manager, symbol=symbol, quantity=quantity))
+        for symbol in symbols
+    ]
     pending_monitor_task = asyncio.create_task(monitor_pending_trades(api_trading_client, trade_manager))
     open_monitor_task = asyncio.create_task(monitor_open_trades(api_trading_client, trade_manager))
-    await asyncio.gather(buy_task, pending_monitor_task, open_monitor_task)
+    flush_task = asyncio.create_task(trade_manager.flush_loop())
+    try:
+        await asyncio.gather(*buy_tasks, pending_monitor_task, open_monitor_task, flush_task)
+    finally:
+        # Persist any state changed since the last write-behind flush
+        trade_manager.flush()
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     api_trading_client = CryptoAPITrading()
     try:
         asyncio.run(main_trading(api_trading_client))
@@ -2,19 +2,36 @@ import os
 import csv
 import logging
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 from typing import Optional
 
-class TradeStatus(Enum):
-    PENDING = "PENDING"
-    OPEN = "OPEN"
-    CLOSED = "CLOSED"
+class TradeStatus(IntEnum):
+    # Int-valued so status checks in the monitor loops are plain integer compares.
+    # The member name is what gets written to and read from the trade CSVs.
+    PENDING = 0
+    OPEN = 1
+    CLOSED = 2
+
+    @classmethod
+    def _missing_(cls, value):
+        # Accept the name ("OPEN"), as stored in the CSVs and the state snapshot
+        if isinstance(value, str):
+            return cls.__members__.get(value)
+        return None
 
 class ExecutedTrade:
     """
     Represents a single trade (Buy -> Sell).
     Stores the raw execution data for later post-processing.
     """
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        "symbol", "quantity", "buy_order_id", "buy_price",
+        "best_bid_buy", "best_ask_buy", "estimated_price_buy",
+        "sell_order_id", "sell_price", "best_bid_sell", "best_ask_sell", "estimated_price_sell",
+        "timestamp_buy", "timestamp_sell", "pnl", "win_loss",
+    )
+
     def __init__(self, symbol, quantity, buy_order_id, buy_price, best_bid, best_ask, estimated_price):
         self.symbol = symbol
         self.quantity = quantity
@@ -31,6 +48,7 @@ class ExecutedTrade:
         self.timestamp_buy = datetime.now()
         self.timestamp_sell = None
         self.pnl = None  # Profit/Loss (calculated when trade is closed)
+        self.win_loss = ""  # "Win" or "Loss", set together with pnl so writers don't recompute it
 
     def close_trade(self, sell_order_id, sell_price, best_bid, best_ask, estimated_price):
         """Closes the trade when a sell order is executed by storing raw sell data and calculating PnL."""
@@ -41,6 +59,7 @@ class ExecutedTrade:
         self.estimated_price_sell = estimated_price
         self.timestamp_sell = datetime.now()
         self.pnl = (self.sell_price - self.buy_price) * self.quantity  # Simple PnL Calculation
+        self.win_loss = "Win" if self.pnl > 0 else "Loss"
 
     def is_closed(self):
         """Checks if the trade has been closed (i.e., sell executed)."""
@@ -50,10 +69,12 @@ class TrackedTrade(ExecutedTrade):
     """
     Extends ExecutedTrade with additional tracking for trade status.
     """
+    __slots__ = ("status",)
+
     def __init__(self, symbol, quantity, buy_order_id, buy_price, best_bid, best_ask, estimated_price, status):
         super().__init__(symbol, quantity, buy_order_id, buy_price, best_bid, best_ask, estimated_price)
         if isinstance(status, str):
-            self.status = TradeStatus(status)
+            self.status = TradeStatus[status]
         else:
             self.status = status
         self.sell_order_id: Optional[str] = None
\ No newline at end of file
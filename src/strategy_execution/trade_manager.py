@@ -1,15 +1,97 @@
 import os
+import gc
 import csv
+import mmap
+import queue
+import struct
+import asyncio
+import atexit
 import logging
+import threading
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime
-from typing import List, Optional
+from typing import ClassVar, Dict, List, Optional, Tuple
 from trade import TrackedTrade, TradeStatus
 
+# Maximum number of closed trades waiting for the background log writer
+LOG_QUEUE_SIZE = 10_000
+
+# Seconds between write-behind flushes of the trade event journal
+SAVE_INTERVAL = 0.5
+
+# Number of journaled events after which the journal is compacted into a binary state snapshot
+JOURNAL_COMPACT_EVERY = 256
+
+# Trade CSVs larger than this (in bytes) are memory-mapped and scanned for active rows instead of parsed line by line
+MMAP_SCAN_THRESHOLD = 50_000_000
+
+# Columns pnl_vector reads from trade CSVs that have no numeric sidecar, with their parsed types
+PNL_DTYPES = {"quantity": "float64", "buy_price": "float64", "sell_price": "float64", "status": "category"}
+
+# Record layout of the closed-trade numeric sidecar: four little-endian float64s per trade
+NUMERIC_DTYPE = np.dtype([("quantity", "<f8"), ("buy_price", "<f8"), ("sell_price", "<f8"), ("pnl", "<f8")])
+_NUMERIC_RECORD = struct.Struct("<dddd")
+
+# Typed columns of the PENDING/OPEN state snapshot, in CSV_FIELDS order
+STATE_SCHEMA = pa.schema([
+    ("buy_timestamp", pa.timestamp("us")),
+    ("buy_order_id", pa.string()),
+    ("sell_timestamp", pa.timestamp("us")),
+    ("sell_order_id", pa.string()),
+    ("symbol", pa.string()),
+    ("quantity", pa.float64()),
+    ("buy_price", pa.float64()),
+    ("sell_price", pa.float64()),
+    ("pnl", pa.float64()),
+    ("win_loss", pa.string()),
+    ("best_bid_buy", pa.float64()),
+    ("best_ask_buy", pa.float64()),
+    ("estimated_price_buy", pa.float64()),
+    ("best_bid_sell", pa.float64()),
+    ("best_ask_sell", pa.float64()),
+    ("estimated_price_sell", pa.float64()),
+    ("status", pa.string()),
+])
+
 class TradeManager:
     """
-    Unifies trade persistence (tracking pending/open trades) and logging (closed trades)
-    into a single CSV file.
+    Unifies trade persistence (tracking pending/open trades) and logging (closed trades).
+
+    CLOSED trades are only ever appended to the trade CSV, with their numeric columns also packed
+    into a binary sidecar for analytics. PENDING/OPEN state changes are appended to a journal next
+    to the CSV (one row per change) and periodically compacted into a typed Parquet state snapshot,
+    so a state change never rewrites any of these files. The active trades are exported to a
+    separate small CSV on shutdown, for human use.
+
+    Durability: CLOSED trades are flushed and fsynced once per batch written by the log writer, so a
+    logged closed trade survives a crash. PENDING/OPEN changes are only flushed to the OS (at most
+    SAVE_INTERVAL after they happen) and the snapshot and export are never fsynced; a crash can lose
+    the latest in-flight updates but never a closed trade already written.
     """
+    # Unified CSV header combining tracking and logging fields; built once and shared by every instance
+    CSV_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "buy_timestamp",
+        "buy_order_id",
+        "sell_timestamp",
+        "sell_order_id",
+        "symbol",
+        "quantity",
+        "buy_price",
+        "sell_price",
+        "pnl",
+        "win_loss",
+        "best_bid_buy",
+        "best_ask_buy",
+        "estimated_price_buy",
+        "best_bid_sell",
+        "best_ask_sell",
+        "estimated_price_sell",
+        "status",
+    )
+
     def __init__(self, filename: Optional[str] = None):
         if filename is None:
             today_date = datetime.now().strftime("%Y-%m-%d")
@@ -17,125 +99,447 @@ class TradeManager:
         else:
             self.filename = filename
         os.makedirs(os.path.dirname(self.filename), exist_ok=True)
-        # Initialize CSV with header if file doesn't exist or is empty.
-        if not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0:
+        # Column positions, so rows are read and written as plain lists instead of per-row dicts
+        self._idx = {name: i for i, name in enumerate(self.CSV_FIELDS)}
+        # Initialize CSV with header if file doesn't exist or is empty (a single stat covers both cases).
+        try:
+            write_header = os.stat(self.filename).st_size == 0
+        except FileNotFoundError:
+            write_header = True
+        if write_header:
             with open(self.filename, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=self.csv_fields())
-                writer.writeheader()
+                csv.writer(f).writerow(self.CSV_FIELDS)
+        # Closed trades are appended through a persistent handle instead of reopening the file
+        self._log_fh = None
+        self._log_writer = None
+        # Closed trades' numeric columns are also appended, packed, to a binary sidecar for analytics
+        self.numeric_filename = os.path.splitext(self.filename)[0] + "_numeric.bin"
+        self._numeric_fh = None
+        # Closed trades are queued and written by a background thread so logging never blocks
+        # the trading loop; the lock keeps appends from interleaving with reads of the CSV.
+        self._file_lock = threading.Lock()
+        self._log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        threading.Thread(target=self._drain_log, daemon=True).start()
+        # PENDING and OPEN trades are loaded once from the state snapshot plus the journal and kept in
+        # memory; callers mutate these dicts directly and record each change with append_event.
+        self.journal_filename = os.path.splitext(self.filename)[0] + "_journal.csv"
+        self.state_filename = os.path.splitext(self.filename)[0] + "_state.parquet"
+        self.active_filename = os.path.splitext(self.filename)[0] + "_open_pending.csv"
+        # Loading creates many long-lived trades at once; pausing the cyclic GC avoids repeated collections over them
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.pending_trades, self.open_trades = self._read_trades()
+            self._replay_journal()
+        finally:
+            if gc_enabled:
+                gc.enable()
+        # Journal handle, opened on the first event; dirty marks events not yet flushed to disk
+        self._journal_fh = None
+        self._journal_writer = None
+        self._journal_events = 0
+        self.dirty = False
+        # Wake the monitors when a trade enters the state they watch, instead of having them poll empty dicts
+        self.pending_nonempty = asyncio.Event()
+        self.open_nonempty = asyncio.Event()
+        # Held by coroutines while they mutate trades and by flush_loop while it persists them
+        self.lock = asyncio.Lock()
+        if self.pending_trades:
+            self.pending_nonempty.set()
+        if self.open_trades:
+            self.open_nonempty.set()
+        atexit.register(self.close)
+
+    def csv_fields(self) -> Tuple[str, ...]:
+        """Returns the unified CSV header (CSV_FIELDS)."""
+        return self.CSV_FIELDS
 
-    def csv_fields(self) -> List[str]:
-        """Unified CSV header combining tracking and logging fields."""
+    def trade_to_row(self, trade: TrackedTrade) -> list:
+        """Converts a TrackedTrade object into a list of CSV values in CSV_FIELDS order."""
         return [
-            "buy_timestamp",
-            "buy_order_id",
-            "sell_timestamp",
-            "sell_order_id",
-            "symbol",
-            "quantity",
-            "buy_price",
-            "sell_price",
-            "pnl",
-            "win_loss",
-            "best_bid_buy",
-            "best_ask_buy",
-            "estimated_price_buy",
-            "best_bid_sell",
-            "best_ask_sell",
-            "estimated_price_sell",
-            "status"
+            trade.timestamp_buy.isoformat(sep=" ", timespec="seconds") if trade.timestamp_buy else "",
+            trade.buy_order_id,
+            trade.timestamp_sell.isoformat(sep=" ", timespec="seconds") if trade.timestamp_sell else "",
+            trade.sell_order_id if trade.sell_order_id else "",
+            trade.symbol,
+            trade.quantity,
+            trade.buy_price,
+            trade.sell_price if trade.sell_price is not None else "",
+            trade.pnl if trade.pnl is not None else "",
+            trade.win_loss,
+            trade.best_bid_buy,
+            trade.best_ask_buy,
+            trade.estimated_price_buy,
+            trade.best_bid_sell if trade.best_bid_sell is not None else "",
+            trade.best_ask_sell if trade.best_ask_sell is not None else "",
+            trade.estimated_price_sell if trade.estimated_price_sell is not None else "",
+            trade.status.name
         ]
 
-    def trade_to_dict(self, trade: TrackedTrade) -> dict:
-        """Converts a TrackedTrade object into a dictionary for CSV writing."""
+    def row_to_trade(self, row: List[str]) -> TrackedTrade:
+        """Converts a CSV row, as a list of values in CSV_FIELDS order, into a TrackedTrade object."""
+        idx = self._idx
+        trade = TrackedTrade(
+            symbol=row[idx["symbol"]],
+            quantity=float(row[idx["quantity"]]),
+            buy_order_id=row[idx["buy_order_id"]],
+            buy_price=float(row[idx["buy_price"]]),
+            best_bid=float(row[idx["best_bid_buy"]]),
+            best_ask=float(row[idx["best_ask_buy"]]),
+            estimated_price=float(row[idx["estimated_price_buy"]]),
+            status=row[idx["status"]]
+        )
+        buy_timestamp = row[idx["buy_timestamp"]]
+        sell_timestamp = row[idx["sell_timestamp"]]
+        sell_order_id = row[idx["sell_order_id"]]
+        sell_price = row[idx["sell_price"]]
+        best_bid_sell = row[idx["best_bid_sell"]]
+        best_ask_sell = row[idx["best_ask_sell"]]
+        estimated_price_sell = row[idx["estimated_price_sell"]]
+        pnl = row[idx["pnl"]]
+        trade.timestamp_buy = datetime.fromisoformat(buy_timestamp) if buy_timestamp else None
+        trade.timestamp_sell = datetime.fromisoformat(sell_timestamp) if sell_timestamp else None
+        trade.sell_order_id = sell_order_id if sell_order_id else None
+        trade.sell_price = float(sell_price) if sell_price else None
+        trade.best_bid_sell = float(best_bid_sell) if best_bid_sell else None
+        trade.best_ask_sell = float(best_ask_sell) if best_ask_sell else None
+        trade.estimated_price_sell = float(estimated_price_sell) if estimated_price_sell else None
+        trade.pnl = float(pnl) if pnl else None
+        trade.win_loss = row[idx["win_loss"]]
+        return trade
+
+    def trade_to_record(self, trade: TrackedTrade) -> dict:
+        """Converts a TrackedTrade object into a typed record for the Parquet state snapshot."""
         return {
-            "buy_timestamp": trade.timestamp_buy.strftime("%Y-%m-%d %H:%M:%S") if trade.timestamp_buy else "",
+            "buy_timestamp": trade.timestamp_buy,
             "buy_order_id": trade.buy_order_id,
-            "sell_timestamp": trade.timestamp_sell.strftime("%Y-%m-%d %H:%M:%S") if trade.timestamp_sell else "",
-            "sell_order_id": trade.sell_order_id if trade.sell_order_id else "",
+            "sell_timestamp": trade.timestamp_sell,
+            "sell_order_id": trade.sell_order_id,
             "symbol": trade.symbol,
             "quantity": trade.quantity,
             "buy_price": trade.buy_price,
-            "sell_price": trade.sell_price if trade.sell_price is not None else "",
-            "pnl": trade.pnl if trade.pnl is not None else "",
-            "win_loss": "Win" if (trade.pnl is not None and trade.pnl > 0) else ("Loss" if trade.pnl is not None else ""),
+            "sell_price": trade.sell_price,
+            "pnl": trade.pnl,
+            "win_loss": trade.win_loss or None,
             "best_bid_buy": trade.best_bid_buy,
             "best_ask_buy": trade.best_ask_buy,
             "estimated_price_buy": trade.estimated_price_buy,
-            "best_bid_sell": trade.best_bid_sell if trade.best_bid_sell is not None else "",
-            "best_ask_sell": trade.best_ask_sell if trade.best_ask_sell is not None else "",
-            "estimated_price_sell": trade.estimated_price_sell if trade.estimated_price_sell is not None else "",
-            "status": trade.status.value
+            "best_bid_sell": trade.best_bid_sell,
+            "best_ask_sell": trade.best_ask_sell,
+            "estimated_price_sell": trade.estimated_price_sell,
+            "status": trade.status.name
         }
 
-    def dict_to_trade(self, row: dict) -> TrackedTrade:
-        """Converts a CSV row dictionary into a TrackedTrade object."""
+    def record_to_trade(self, record: dict) -> TrackedTrade:
+        """Converts a Parquet state snapshot record into a TrackedTrade object. Values are already typed."""
         trade = TrackedTrade(
-            symbol=row["symbol"],
-            quantity=float(row["quantity"]),
-            buy_order_id=row["buy_order_id"],
-            buy_price=float(row["buy_price"]),
-            best_bid=float(row["best_bid_buy"]),
-            best_ask=float(row["best_ask_buy"]),
-            estimated_price=float(row["estimated_price_buy"]),
-            status=row["status"]
+            symbol=record["symbol"],
+            quantity=record["quantity"],
+            buy_order_id=record["buy_order_id"],
+            buy_price=record["buy_price"],
+            best_bid=record["best_bid_buy"],
+            best_ask=record["best_ask_buy"],
+            estimated_price=record["estimated_price_buy"],
+            status=record["status"]
         )
-        trade.timestamp_buy = datetime.strptime(row["buy_timestamp"], "%Y-%m-%d %H:%M:%S") if row["buy_timestamp"] else None
-        trade.timestamp_sell = datetime.strptime(row["sell_timestamp"], "%Y-%m-%d %H:%M:%S") if row["sell_timestamp"] else None
-        trade.sell_order_id = row["sell_order_id"] if row["sell_order_id"] else None
-        trade.sell_price = float(row["sell_price"]) if row["sell_price"] not in ("", None) else None
-        trade.best_bid_sell = float(row["best_bid_sell"]) if row["best_bid_sell"] not in ("", None) else None
-        trade.best_ask_sell = float(row["best_ask_sell"]) if row["best_ask_sell"] not in ("", None) else None
-        trade.estimated_price_sell = float(row["estimated_price_sell"]) if row["estimated_price_sell"] not in ("", None) else None
-        trade.pnl = float(row["pnl"]) if row["pnl"] not in ("", None) else None
+        trade.timestamp_buy = record["buy_timestamp"]
+        trade.timestamp_sell = record["sell_timestamp"]
+        trade.sell_order_id = record["sell_order_id"]
+        trade.sell_price = record["sell_price"]
+        trade.best_bid_sell = record["best_bid_sell"]
+        trade.best_ask_sell = record["best_ask_sell"]
+        trade.estimated_price_sell = record["estimated_price_sell"]
+        trade.pnl = record["pnl"]
+        trade.win_loss = record["win_loss"] or ""
         return trade
 
     def load_trades(self):
         """
-        Loads trades from CSV and separates them into lists for PENDING and OPEN statuses.
-        CLOSED trades are preserved only as historical records.
+        Returns the in-memory PENDING and OPEN trade dicts keyed by buy_order_id.
+        They are loaded once, from the state snapshot and the journal, when the manager is created.
+        """
+        return self.pending_trades, self.open_trades
+
+    def _read_trades(self):
+        """
+        Reads the PENDING and OPEN trades, keyed by buy_order_id, from the state snapshot. Falls back
+        to the exported active trades when no snapshot exists yet, and to the trade CSV for logs written
+        before active trades had their own file.
         """
-        pending_trades = []
-        open_trades = []
-        if not os.path.exists(self.filename):
+        pending_trades = {}
+        open_trades = {}
+        if os.path.exists(self.state_filename):
+            for record in pq.read_table(self.state_filename, schema=STATE_SCHEMA).to_pylist():
+                trade = self.record_to_trade(record)
+                if trade.status == TradeStatus.PENDING:
+                    pending_trades[trade.buy_order_id] = trade
+                elif trade.status == TradeStatus.OPEN:
+                    open_trades[trade.buy_order_id] = trade
             return pending_trades, open_trades
-        with open(self.filename, "r", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row["status"] == TradeStatus.PENDING.value:
-                    pending_trades.append(self.dict_to_trade(row))
-                elif row["status"] == TradeStatus.OPEN.value:
-                    open_trades.append(self.dict_to_trade(row))
+
+        filename = self.active_filename if os.path.exists(self.active_filename) else self.filename
+        if not os.path.exists(filename):
+            return pending_trades, open_trades
+        order_id_col = self._idx["buy_order_id"]
+        status_col = self._idx["status"]
+        if os.path.getsize(filename) > MMAP_SCAN_THRESHOLD:
+            rows = self._scan_active_rows(filename)
+        else:
+            with open(filename, "r", newline="", buffering=1 << 20) as f:
+                reader = csv.reader(f)
+                next(reader, None)  # Skip header
+                rows = list(reader)
+        for row in rows:
+            if row[status_col] == TradeStatus.PENDING.name:
+                pending_trades[row[order_id_col]] = self.row_to_trade(row)
+            elif row[status_col] == TradeStatus.OPEN.name:
+                open_trades[row[order_id_col]] = self.row_to_trade(row)
         return pending_trades, open_trades
 
-    def save_trades(self, pending_list: List[TrackedTrade], open_list: List[TrackedTrade]):
-        """
-        Persists the PENDING and OPEN trades while preserving already logged CLOSED trades.
-        """
-        closed_rows = []
-        if os.path.exists(self.filename):
-            with open(self.filename, "r", newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row["status"] == TradeStatus.CLOSED.value:
-                        closed_rows.append(row)
-        with open(self.filename, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.csv_fields())
-            writer.writeheader()
-            for trade in pending_list:
-                writer.writerow(self.trade_to_dict(trade))
-            for trade in open_list:
-                writer.writerow(self.trade_to_dict(trade))
-            for row in closed_rows:
-                writer.writerow(row)
+    def _scan_active_rows(self, filename: str) -> List[List[str]]:
+        """
+        Picks the PENDING and OPEN rows out of a large trade CSV without decoding the CLOSED history.
+        Status is the last column, so the file is memory-mapped and searched in C for lines ending in
+        an active status; only those lines are decoded and parsed.
+
+        Args:
+            filename (str): Path of the CSV to scan.
+
+        Returns:
+            List[List[str]]: The matching rows, in file order.
+        """
+        lines = []
+        with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for status in (TradeStatus.PENDING, TradeStatus.OPEN):
+                marker = f",{status.name}\r\n".encode()
+                pos = mm.find(marker)
+                while pos != -1:
+                    end = pos + len(marker)
+                    start = mm.rfind(b"\n", 0, pos) + 1
+                    lines.append((start, mm[start:end].decode()))
+                    pos = mm.find(marker, end)
+        lines.sort()
+        return list(csv.reader(line for _, line in lines))
+
+    def _replay_journal(self):
+        """
+        Applies journaled state changes on top of the loaded state snapshot. Each journal row is
+        a trade's full state after a change, so replaying events already in the snapshot is harmless.
+        """
+        if not os.path.exists(self.journal_filename):
+            return
+        order_id_col = self._idx["buy_order_id"]
+        status_col = self._idx["status"]
+        with open(self.journal_filename, "r", newline="", buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header
+            for row in reader:
+                order_id = row[order_id_col]
+                self.pending_trades.pop(order_id, None)
+                self.open_trades.pop(order_id, None)
+                if row[status_col] == TradeStatus.PENDING.name:
+                    self.pending_trades[order_id] = self.row_to_trade(row)
+                elif row[status_col] == TradeStatus.OPEN.name:
+                    self.open_trades[order_id] = self.row_to_trade(row)
+
+    def append_event(self, trade: TrackedTrade):
+        """
+        Journals a trade's new state after it changes (new buy, fill, sell placed, or closed).
+        The row is buffered and written to disk by the next flush. Also wakes the monitor for the trade's new state.
+        """
+        if trade.status == TradeStatus.PENDING:
+            self.pending_nonempty.set()
+        elif trade.status == TradeStatus.OPEN:
+            self.open_nonempty.set()
+        if self._journal_writer is None:
+            try:
+                write_header = os.stat(self.journal_filename).st_size == 0
+            except FileNotFoundError:
+                write_header = True
+            self._journal_fh = open(self.journal_filename, "a", newline="", buffering=1 << 16)
+            self._journal_writer = csv.writer(self._journal_fh)
+            if write_header:
+                self._journal_writer.writerow(self.CSV_FIELDS)
+        self._journal_writer.writerow(self.trade_to_row(trade))
+        self._journal_events += 1
+        self.dirty = True
+
+    def compact(self):
+        """
+        Writes the in-memory trades to the state snapshot and truncates the journal.
+        """
+        self._write_state()
+        if self._journal_fh is not None:
+            self._journal_fh.close()
+            self._journal_fh = None
+            self._journal_writer = None
+        # Once the snapshot is in place every journaled event is redundant
+        open(self.journal_filename, "w").close()
+        self._journal_events = 0
+
+    def _write_state(self):
+        """
+        Writes the PENDING and OPEN trades as a typed Parquet table to a temporary file and atomically
+        swaps it in as the snapshot, so loading it parses no strings.
+        """
+        records = [self.trade_to_record(trade) for trade in self.pending_trades.values()]
+        records.extend(self.trade_to_record(trade) for trade in self.open_trades.values())
+        tmp_filename = self.state_filename + ".tmp"
+        pq.write_table(pa.Table.from_pylist(records, schema=STATE_SCHEMA), tmp_filename, compression="snappy")
+        os.replace(tmp_filename, self.state_filename)
+
+    def save_trades(self, pending_trades: Optional[Dict[str, TrackedTrade]] = None,
+                    open_trades: Optional[Dict[str, TrackedTrade]] = None):
+        """
+        Exports the PENDING and OPEN trades to the active trades CSV. Defaults to the manager's
+        in-memory trades. CLOSED trades live in the append-only trade CSV and are never rewritten,
+        so the cost scales with the active trades only. The export is written to a temporary file
+        and swapped in atomically.
+        """
+        if pending_trades is None:
+            pending_trades = self.pending_trades
+        if open_trades is None:
+            open_trades = self.open_trades
+        tmp_filename = self.active_filename + ".tmp"
+        with open(tmp_filename, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.CSV_FIELDS)
+            writer.writerows(map(self.trade_to_row, pending_trades.values()))
+            writer.writerows(map(self.trade_to_row, open_trades.values()))
+        os.replace(tmp_filename, self.active_filename)
+
+    def pnl_vector(self) -> np.ndarray:
+        """
+        Returns the PnL of every logged CLOSED trade, read from the binary sidecar without any parsing.
+        Trade logs written before the sidecar existed fall back to parsing the CSV.
+
+        Returns:
+            np.ndarray: float64 PnL per closed trade, in log order.
+        """
+        if os.path.exists(self.numeric_filename):
+            return np.ascontiguousarray(self.load_numeric_history()["pnl"])
+
+        self._log_queue.join()
+        with self._file_lock:
+            self._flush_log()
+            # Tokenizing and float parsing happen in pandas' C parser instead of per-cell float() calls
+            df = pd.read_csv(self.filename, usecols=list(PNL_DTYPES), dtype=PNL_DTYPES)
+
+        closed = df[df["status"] == TradeStatus.CLOSED.name]
+        return ((closed["sell_price"] - closed["buy_price"]) * closed["quantity"]).to_numpy(dtype=np.float64)
+
+    def flush(self):
+        """
+        Writes journaled events to disk, compacting the journal once it has grown past JOURNAL_COMPACT_EVERY events.
+        """
+        if self.dirty:
+            self.dirty = False
+            self._journal_fh.flush()
+            if self._journal_events >= JOURNAL_COMPACT_EVERY:
+                self.compact()
+
+    async def flush_loop(self, interval: float = SAVE_INTERVAL):
+        """
+        Write-behind task: flushes journaled trade events at most once per interval, so bursts of
+        state transitions cost a single write. The flush (and any compaction) runs in a worker thread
+        under the lock, so the event loop keeps running while no trade can change mid-write.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            if not self.dirty:
+                continue
+            async with self.lock:
+                await asyncio.to_thread(self.flush)
 
     def log_trade(self, trade: TrackedTrade):
         """
-        Logs a closed trade by appending it to the CSV.
+        Queues a closed trade to be appended to the CSV by the background log writer.
         """
         if not trade.is_closed():
             logging.warning(f"Trade for {trade.symbol} not closed yet. Skipping logging.")
             return
-        with open(self.filename, "a", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.csv_fields())
-            writer.writerow(self.trade_to_dict(trade))
-        logging.info(f"[SUCCESS] Trade logged: {trade.symbol}, PnL: {trade.pnl} ({'Win' if trade.pnl and trade.pnl > 0 else 'Loss'})")
\ No newline at end of file
+        try:
+            self._log_queue.put_nowait(trade)
+        except queue.Full:
+            logging.error(f"Trade log queue full. Dropping closed trade for {trade.symbol} (sell order {trade.sell_order_id}).")
+
+    def _drain_log(self):
+        """
+        Background writer loop: takes every closed trade queued so far and appends them to the CSV
+        with one writerows call, then flushes and fsyncs once per batch.
+        """
+        while True:
+            trades = [self._log_queue.get()]
+            while True:
+                try:
+                    trades.append(self._log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                rows = [self.trade_to_row(trade) for trade in trades]
+                with self._file_lock:
+                    if self._log_writer is None:
+                        self._log_fh = open(self.filename, "a", newline="", buffering=1 << 16)
+                        self._log_writer = csv.writer(self._log_fh)
+                        self._numeric_fh = open(self.numeric_filename, "ab", buffering=1 << 16)
+                    self._log_writer.writerows(rows)
+                    self._numeric_fh.write(b"".join(map(self._pack_numeric, trades)))
+                    self._numeric_fh.flush()
+                    # One flush + fsync per drained batch makes closed trades durable without a sync per row
+                    self._log_fh.flush()
+                    os.fsync(self._log_fh.fileno())
+                for trade in trades:
+                    logging.info(f"[SUCCESS] Trade logged: {trade.symbol}, PnL: {trade.pnl} ({trade.win_loss or 'Loss'})")
+            except Exception as e:
+                logging.error(f"Error logging {len(trades)} closed trade(s): {e}")
+            finally:
+                for _ in trades:
+                    self._log_queue.task_done()
+
+    def _pack_numeric(self, trade: TrackedTrade) -> bytes:
+        """Packs a closed trade's quantity, prices and PnL into one NUMERIC_DTYPE record."""
+        return _NUMERIC_RECORD.pack(
+            trade.quantity,
+            trade.buy_price,
+            trade.sell_price if trade.sell_price is not None else np.nan,
+            trade.pnl if trade.pnl is not None else np.nan
+        )
+
+    def load_numeric_history(self) -> np.ndarray:
+        """
+        Reads the numeric columns of every closed trade logged to the binary sidecar, with no parsing.
+
+        Returns:
+            np.ndarray: Structured NUMERIC_DTYPE array (quantity, buy_price, sell_price, pnl), in log order.
+        """
+        self._log_queue.join()
+        with self._file_lock:
+            if self._numeric_fh is not None:
+                self._numeric_fh.flush()
+            if not os.path.exists(self.numeric_filename):
+                return np.empty(0, dtype=NUMERIC_DTYPE)
+            # Ignore a partial record left by a crash mid-write
+            count = os.path.getsize(self.numeric_filename) // NUMERIC_DTYPE.itemsize
+            return np.fromfile(self.numeric_filename, dtype=NUMERIC_DTYPE, count=count)
+
+    def _flush_log(self):
+        """Flushes buffered closed-trade rows so the CSV on disk is complete before it is read. Caller holds the file lock."""
+        if self._log_fh is not None:
+            self._log_fh.flush()
+
+    def close(self):
+        """
+        Compacts journaled changes, exports the active trades and waits for queued closed trades
+        to be written, then closes the log handle.
+        """
+        if self._journal_events:
+            self.compact()
+        self.save_trades()
+        self._log_queue.join()
+        with self._file_lock:
+            if self._log_fh is not None:
+                self._log_fh.close()
+                self._log_fh = None
+                self._log_writer = None
+                self._numeric_fh.close()
+                self._numeric_fh = None
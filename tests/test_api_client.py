@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("requests")
+pytest.importorskip("cryptography")
+pytest.importorskip("orjson")
+
+from src.robinhood_api.api_client import APIClient
+
+
+class FakeResponse:
+    status_code = 200
+    content = b'{"ok": true}'
+    headers = {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def test_post_body_with_numpy_scalars_is_serialized():
+    client = APIClient("api-key", bytes(range(32)))
+    sent = []
+
+    def fake_post(url, headers, data, timeout):
+        sent.append(data)
+        return FakeResponse()
+
+    client.session.post = fake_post
+    response = client.make_api_request("POST", "/orders/", {"quantity": np.float64(0.5), "count": np.int64(2)})
+
+    assert response == {"ok": True}
+    assert json.loads(sent[0]) == {"quantity": 0.5, "count": 2}
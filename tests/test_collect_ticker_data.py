@@ -0,0 +1,73 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+pytest.importorskip("nest_asyncio")
+
+from src.data_processing import collect_ticker_data
+
+
+def _yesterday():
+    return (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def _quotes(date_str, minute, bid, ask):
+    return pd.DataFrame({
+        "timestamp": [pd.Timestamp(f"{date_str} 01:{minute:02d}:00", tz="UTC")],
+        "symbol": ["BTC-USD"],
+        "price_bid": [bid],
+        "price_ask": [ask],
+    })
+
+
+def test_consolidation_merges_string_and_float_columns(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    temp_folder = tmp_path / "data" / "BTC" / "temp"
+    temp_folder.mkdir(parents=True)
+    date_str = _yesterday()
+    # Older collectors stored prices as strings; newer ones store float64
+    _quotes(date_str, 0, "100.5", "101").to_parquet(temp_folder / f"batch_{date_str}_000100.parquet", index=False)
+    _quotes(date_str, 1, 100.75, 101.25).to_parquet(temp_folder / f"batch_{date_str}_000200.parquet", index=False)
+
+    collect_ticker_data.consolidate_parquet_files_partitioned("BTC")
+
+    assert not list(temp_folder.glob("*.parquet"))
+    df = pd.read_parquet(tmp_path / "data" / "BTC").sort_values("Date")
+    assert df["bid price"].tolist() == pytest.approx([100.5, 100.75])
+    assert df["ask price"].tolist() == pytest.approx([101.0, 101.25])
+
+
+def test_reconcile_manifest_lists_unrecorded_files(tmp_path):
+    temp_folder = tmp_path / "temp"
+    temp_folder.mkdir()
+    date_str = _yesterday()
+    recorded = f"batch_{date_str}_000100.parquet"
+    unrecorded = f"batch_{date_str}_000200.parquet"
+    for file_name in (recorded, unrecorded):
+        _quotes(date_str, 0, 1.0, 2.0).to_parquet(temp_folder / file_name, index=False)
+    # Written under the old name, and listing a file that has since been removed
+    (temp_folder / collect_ticker_data.LEGACY_MANIFEST_FILENAME).write_text(
+        f"batch_{date_str}_000000.parquet\t{date_str}\n{recorded}\t{date_str}\n"
+    )
+
+    collect_ticker_data.reconcile_manifest(str(temp_folder))
+
+    assert not (temp_folder / collect_ticker_data.LEGACY_MANIFEST_FILENAME).exists()
+    assert collect_ticker_data.read_manifest(str(temp_folder)) == [(recorded, date_str), (unrecorded, date_str)]
+
+
+def test_manifest_does_not_break_reading_the_dataset(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    temp_folder = tmp_path / "data" / "BTC" / "temp"
+    temp_folder.mkdir(parents=True)
+    date_str = _yesterday()
+    _quotes(date_str, 0, 100.5, 101.0).to_parquet(temp_folder / f"batch_{date_str}_000100.parquet", index=False)
+    collect_ticker_data.reconcile_manifest(str(temp_folder))
+
+    collect_ticker_data.consolidate_parquet_files_partitioned("BTC")
+
+    assert os.path.exists(temp_folder / collect_ticker_data.MANIFEST_FILENAME)
+    assert len(pd.read_parquet(tmp_path / "data" / "BTC")) == 1
@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+pytest.importorskip("schedule")
+
+from src.portfolio_analytics.execution_analytics import ExecutionSummary
+
+
+def _trade(timestamp, estimated, actual, price):
+    return {
+        "Timestamp": timestamp,
+        "Estimated Slippage (%)": estimated,
+        "Actual Slippage (%)": actual,
+        "Execution Price": price,
+    }
+
+
+def test_update_summary_aggregates_last_hour(tmp_path):
+    summary_file = tmp_path / "execution_summary.csv"
+    summary = ExecutionSummary(trade_log=str(tmp_path / "trade_log"), summary_file=str(summary_file))
+    now = datetime.now()
+    summary.append_trades([
+        _trade(now - timedelta(hours=2), 9.0, 9.0, 900.0),  # Older than an hour, filtered out
+        _trade(now - timedelta(minutes=30), 0.1, 0.2, 100.0),
+        _trade(now - timedelta(minutes=5), 0.3, 0.4, 300.0),
+    ])
+
+    summary.update_summary()
+
+    df = pd.read_csv(summary_file)
+    assert len(df) == 1
+    row = df.iloc[0]
+    assert row["Total Trades"] == 2
+    assert row["Avg Estimated Slippage (%)"] == pytest.approx(0.2)
+    assert row["Avg Actual Slippage (%)"] == pytest.approx(0.3)
+    assert row["Avg Execution Price"] == pytest.approx(200.0)
+
+
+def test_update_summary_skips_when_no_recent_trades(tmp_path):
+    summary_file = tmp_path / "execution_summary.csv"
+    summary = ExecutionSummary(trade_log=str(tmp_path / "trade_log"), summary_file=str(summary_file))
+    summary.append_trades([_trade(datetime.now() - timedelta(hours=3), 0.1, 0.1, 1.0)])
+
+    summary.update_summary()
+
+    assert not summary_file.exists()
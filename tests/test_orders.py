@@ -0,0 +1,32 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("requests")
+
+from src.robinhood_api.orders import Orders
+
+
+class RecordingClient:
+    """Stands in for APIClient and records the body of each request."""
+
+    def __init__(self):
+        self.bodies = []
+
+    def make_api_request(self, method, path, body=""):
+        self.bodies.append(body)
+        return {"id": "order-1"}
+
+
+def test_limit_order_accepts_numpy_floats_and_sends_builtin_floats():
+    client = RecordingClient()
+    Orders(client).place_limit_order("BTC-USD", "buy", np.float64(0.5), np.float64(100.25))
+
+    config = client.bodies[0]["limit_order_config"]
+    assert config["quantity"] == 0.5 and type(config["quantity"]) is float
+    assert config["limit_price"] == 100.25 and type(config["limit_price"]) is float
+
+
+@pytest.mark.parametrize("quantity", [True, 0, -1.0, "1"])
+def test_market_order_rejects_invalid_quantity(quantity):
+    with pytest.raises(ValueError):
+        Orders(RecordingClient()).place_market_order("BTC-USD", "buy", quantity)
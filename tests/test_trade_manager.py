@@ -0,0 +1,41 @@
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+# trade_manager imports its sibling module as "trade", as it does when run from its own directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "strategy_execution"))
+
+from trade import TrackedTrade, TradeStatus
+from trade_manager import TradeManager
+
+
+def _closed_trade(order_id, buy_price, sell_price, quantity=2.0):
+    trade = TrackedTrade("DOGE-USD", quantity, order_id, buy_price, buy_price, buy_price, buy_price, TradeStatus.OPEN)
+    trade.close_trade(f"sell-{order_id}", sell_price, sell_price, sell_price, sell_price)
+    trade.status = TradeStatus.CLOSED
+    return trade
+
+
+def test_pnl_vector_reads_the_numeric_sidecar(tmp_path):
+    manager = TradeManager(str(tmp_path / "trades.csv"))
+    manager.log_trade(_closed_trade("a", 1.0, 1.5))
+    manager.log_trade(_closed_trade("b", 2.0, 1.0))
+
+    assert manager.pnl_vector() == pytest.approx([1.0, -2.0])
+    history = manager.load_numeric_history()
+    assert history["sell_price"] == pytest.approx([1.5, 1.0])
+    manager.close()
+
+
+def test_pnl_vector_falls_back_to_the_csv_without_a_sidecar(tmp_path):
+    manager = TradeManager(str(tmp_path / "trades.csv"))
+    manager.log_trade(_closed_trade("a", 1.0, 1.25))
+    manager.close()
+    os.remove(manager.numeric_filename)
+
+    assert TradeManager(str(tmp_path / "trades.csv")).pnl_vector() == pytest.approx([0.5])